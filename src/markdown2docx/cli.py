@@ -5,6 +5,7 @@ format with support for templates, configuration, and various output options.
 """
 
 import argparse
+import functools
 import logging
 import sys
 from pathlib import Path
@@ -18,18 +19,8 @@ from .templates import DocxTemplateManager
 # Configure CLI logger
 logger = logging.getLogger(__name__)
 
-
-def create_argument_parser() -> argparse.ArgumentParser:
-    """Create and configure the command line argument parser.
-
-    Returns:
-        Configured ArgumentParser instance
-    """
-    parser = argparse.ArgumentParser(
-        prog="markdown2docx",
-        description="Convert Markdown files to modern DOCX format with advanced features",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+# Help epilog shown by --help; built once at import time
+_EPILOG = """
 Examples:
   %(prog)s document.md                           # Basic conversion
   %(prog)s document.md -o report.docx            # Specify output file
@@ -44,7 +35,25 @@ Configuration:
     MD2DOCX_CONVERSION__DEFAULT_TOC=true
     MD2DOCX_TEMPLATE__BODY_FONT=Arial
     MD2DOCX_LOGGING__LEVEL=DEBUG
-        """,
+        """
+
+
+@functools.lru_cache(maxsize=1)
+def create_argument_parser() -> argparse.ArgumentParser:
+    """Create and configure the command line argument parser.
+
+    The parser is built once per process and reused; parsing arguments does
+    not mutate the parser configuration, so sharing it across repeated
+    ``main()`` invocations is safe.
+
+    Returns:
+        Configured ArgumentParser instance
+    """
+    parser = argparse.ArgumentParser(
+        prog="markdown2docx",
+        description="Convert Markdown files to modern DOCX format with advanced features",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_EPILOG,
     )
 
     # Input/output arguments
@@ -212,12 +221,14 @@ def handle_conversion(
                 depth = toc_depth or config.conversion.default_toc_depth
                 print(f"   📑 Table of contents: {depth} levels")
 
-            # Show Pandoc version info
-            try:
-                pandoc_version = converter.get_pandoc_version()
-                print(f"   🔧 Pandoc version: {pandoc_version}")
-            except MarkdownToDocxError:
-                logger.debug("Pandoc version unavailable for verbose output")
+            # Show Pandoc version info; skip the version query entirely when
+            # quiet mode has raised the log level (e.g. -v -q together)
+            if logger.isEnabledFor(logging.INFO):
+                try:
+                    pandoc_version = converter.get_pandoc_version()
+                    print(f"   🔧 Pandoc version: {pandoc_version}")
+                except MarkdownToDocxError:
+                    logger.debug("Pandoc version unavailable for verbose output")
 
         return 0
 
@@ -6,16 +6,24 @@ default values, environment variables, and configuration files.
 
 from __future__ import annotations
 
+import functools
 import os
-import tomllib
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
 
 from .exceptions import ConfigurationError
 
+# Environment variable prefix for configuration overrides
+_ENV_PREFIX = "MD2DOCX_"
+_ENV_PREFIX_LEN = len(_ENV_PREFIX)
 
-@dataclass
+# Shared empty mapping so empty results never expose the cache to mutation
+_EMPTY_MAPPING: Mapping[str, Any] = MappingProxyType({})
+
+
+@dataclass(frozen=True, slots=True)
 class PandocConfig:
     """Configuration for Pandoc-related settings."""
 
@@ -33,8 +41,11 @@ class PandocConfig:
     timeout_seconds: int = 300
     """Timeout for Pandoc operations in seconds."""
 
+    use_server: bool = False
+    """Whether to route conversions through a long-lived pandoc-server process."""
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TemplateConfig:
     """Configuration for DOCX template settings."""
 
@@ -60,7 +71,7 @@ class TemplateConfig:
     """Default code block font size in points."""
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ConversionConfig:
     """Configuration for conversion settings."""
 
@@ -73,14 +84,20 @@ class ConversionConfig:
     validate_output: bool = False
     """Whether to validate output DOCX files by default."""
 
+    deep_validate: bool = False
+    """Whether validation fully parses the output document (slow for large files)."""
+
     create_backup: bool = False
     """Whether to create backup of existing output files."""
 
     overwrite_existing: bool = True
     """Whether to overwrite existing output files."""
 
+    cache_dir: Optional[str] = None
+    """Optional directory for the content-hash conversion cache."""
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LoggingConfig:
     """Configuration for logging settings."""
 
@@ -94,7 +111,7 @@ class LoggingConfig:
     """Optional log file path."""
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MarkdownToDocxConfig:
     """Main configuration class for markdown2docx."""
 
@@ -117,10 +134,23 @@ class MarkdownToDocxConfig:
             ConfigurationError: If configuration is invalid
         """
         try:
-            pandoc_config = PandocConfig(**config_dict.get("pandoc", {}))
-            template_config = TemplateConfig(**config_dict.get("template", {}))
-            conversion_config = ConversionConfig(**config_dict.get("conversion", {}))
-            logging_config = LoggingConfig(**config_dict.get("logging", {}))
+            # Empty or missing sections reuse the shared default instances;
+            # sharing is safe because the section dataclasses are frozen
+            pandoc = config_dict.get("pandoc")
+            template = config_dict.get("template")
+            conversion = config_dict.get("conversion")
+            log_section = config_dict.get("logging")
+
+            pandoc_config = PandocConfig(**pandoc) if pandoc else _DEFAULT_PANDOC
+            template_config = (
+                TemplateConfig(**template) if template else _DEFAULT_TEMPLATE
+            )
+            conversion_config = (
+                ConversionConfig(**conversion) if conversion else _DEFAULT_CONVERSION
+            )
+            logging_config = (
+                LoggingConfig(**log_section) if log_section else _DEFAULT_LOGGING
+            )
 
             return cls(
                 pandoc=pandoc_config,
@@ -153,36 +183,70 @@ class MarkdownToDocxConfig:
         Returns:
             List of Pandoc command line arguments
         """
-        args = ["-f", self.pandoc.reader_format, "-t", self.pandoc.writer_format]
+        return list(
+            _build_pandoc_args(
+                self.pandoc.reader_format,
+                self.pandoc.writer_format,
+                toc,
+                toc_depth,
+            )
+        )
 
-        if toc:
-            args.extend(["--toc", "--toc-depth", str(toc_depth)])
 
-        return args
+@functools.lru_cache(maxsize=8)
+def _build_pandoc_args(
+    reader_format: str, writer_format: str, toc: bool, toc_depth: int
+) -> Tuple[str, ...]:
+    """Build the base Pandoc argument tuple for a format/TOC combination.
 
+    Memoized so batch conversions that reuse the same configuration pay for
+    the argument construction only once; callers copy the cached tuple into
+    a fresh list before extending it.
+    """
+    args = ("-f", reader_format, "-t", writer_format)
+    if toc:
+        args += ("--toc", "--toc-depth", str(toc_depth))
+    return args
 
+
+# Recognized boolean spellings for environment variable values
+_TRUE_VALUES = frozenset({"true", "yes", "1", "on"})
+_FALSE_VALUES = frozenset({"false", "no", "0", "off"})
+
+
+@functools.lru_cache(maxsize=256)
 def _parse_env_value(value: str) -> Any:
     """Parse environment variable value to appropriate Python type.
 
+    Memoized: env values repeat heavily across reloads (booleans and small
+    numbers dominate), so repeated parses collapse to a dict probe.
+
     Args:
         value: String value from environment variable
 
     Returns:
         Parsed value (bool, int, float, or str)
     """
-    # Handle boolean values
-    if value.lower() in ("true", "yes", "1", "on"):
+    # Handle boolean values with a single lowercase pass and set lookups
+    lowered = value.lower()
+    if lowered in _TRUE_VALUES:
         return True
-    if value.lower() in ("false", "no", "0", "off"):
+    if lowered in _FALSE_VALUES:
         return False
 
-    # Handle numeric values
-    try:
-        if "." in value:
-            return float(value)
+    # Handle integers without exception control flow; isdecimal() matches
+    # exactly the digit runs int() accepts, whereas isdigit() also passes
+    # superscripts and the like that int() rejects
+    unsigned = value[1:] if value[:1] == "-" else value
+    if unsigned.isdecimal():
         return int(value)
-    except ValueError:
-        pass
+
+    # Handle floats; only strings containing a dot can qualify
+    if "." in value:
+        try:
+            return float(value)
+        except ValueError:
+            pass
 
     # Return as string
     return value
@@ -190,13 +254,31 @@ def _parse_env_value(value: str) -> Any:
 
 def _parse_env_config() -> Dict[str, Any]:
     """Parse MD2DOCX_* environment variables into a nested config dictionary."""
-    config_dict: Dict[str, Any] = {}
+    # Filter the environment once at C speed, then delegate the per-variable
+    # parsing to a memoized helper keyed on the filtered items so repeated
+    # calls with an unchanged environment are a single cache probe.
+    items = tuple(
+        sorted(
+            (key, value)
+            for key, value in os.environ.items()
+            if key[:_ENV_PREFIX_LEN] == _ENV_PREFIX
+        )
+    )
+    return _parse_env_items(items)
+
 
-    for key, value in os.environ.items():
-        if not key.startswith("MD2DOCX_"):
-            continue
+@functools.lru_cache(maxsize=1)
+def _parse_env_items(items: Tuple[Tuple[str, str], ...]) -> Dict[str, Any]:
+    """Build the nested config dictionary from pre-filtered environment items.
+
+    The returned dictionary is cached and must be treated as read-only by
+    callers. Use ``_parse_env_items.cache_clear()`` to invalidate after
+    mutating ``os.environ`` mid-process.
+    """
+    config_dict: Dict[str, Any] = {}
 
-        config_key = key[8:].lower()
+    for key, value in items:
+        config_key = key[_ENV_PREFIX_LEN:].lower()
         if "__" in config_key:
             section, setting = config_key.split("__", 1)
             section_values = config_dict.setdefault(section, {})
@@ -208,8 +290,30 @@ def _parse_env_config() -> Dict[str, Any]:
     return config_dict
 
 
-def _load_config_file(config_path: Path) -> Dict[str, Any]:
-    """Load config data from TOML or YAML file."""
+def _load_config_file(config_path: Path) -> Mapping[str, Any]:
+    """Load config data from TOML or YAML file.
+
+    Results are cached keyed on the file's path, modification time, and
+    size, so repeated loads of an unchanged file skip the re-read and
+    re-parse. The returned mapping is a read-only view of the cached data.
+    """
+    try:
+        file_stat = config_path.stat()
+    except OSError as exc:
+        raise ConfigurationError(
+            "config_path", f"Unable to read config file: {exc}"
+        ) from exc
+    return _load_config_file_cached(
+        str(config_path), file_stat.st_mtime_ns, file_stat.st_size
+    )
+
+
+@functools.lru_cache(maxsize=16)
+def _load_config_file_cached(
+    path_str: str, mtime_ns: int, size: int
+) -> Mapping[str, Any]:
+    """Read and parse a config file; cached per (path, mtime, size)."""
+    config_path = Path(path_str)
     suffix = config_path.suffix.lower()
     loaded: Any
     try:
@@ -220,6 +324,10 @@ def _load_config_file(config_path: Path) -> Dict[str, Any]:
         ) from exc
 
     if suffix == ".toml":
+        # Imported lazily so env-only CLI invocations skip the module load;
+        # sys.modules makes repeated imports effectively free.
+        import tomllib
+
         try:
             loaded = tomllib.loads(content)
         except tomllib.TOMLDecodeError as exc:
@@ -247,19 +355,24 @@ def _load_config_file(config_path: Path) -> Dict[str, Any]:
         )
 
     if loaded is None:
-        return {}
+        return _EMPTY_MAPPING
     if not isinstance(loaded, dict):
         raise ConfigurationError("config_path", "Configuration root must be a mapping.")
-    return loaded
+    return MappingProxyType(loaded)
+
 
+def _merge_config(base: Mapping[str, Any], override: Mapping[str, Any]) -> Dict[str, Any]:
+    """Merge config dictionaries; values in override take precedence.
 
-def _merge_config(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
-    """Recursively merge config dictionaries; values in override take precedence."""
+    The config schema is one level deep (section -> settings), so a flat
+    single-pass merge is sufficient; sections present on both sides are
+    combined with a dict-unpacking merge instead of recursion.
+    """
     merged = dict(base)
     for key, value in override.items():
         existing = merged.get(key)
         if isinstance(existing, dict) and isinstance(value, dict):
-            merged[key] = _merge_config(existing, value)
+            merged[key] = {**existing, **value}
         else:
             merged[key] = value
     return merged
@@ -277,7 +390,7 @@ def load_config(config_path: Optional[Path] = None) -> MarkdownToDocxConfig:
     Raises:
         ConfigurationError: If configuration file is invalid
     """
-    file_config: Dict[str, Any] = {}
+    file_config: Mapping[str, Any] = _EMPTY_MAPPING
     if config_path and config_path.exists():
         file_config = _load_config_file(config_path)
 
@@ -286,5 +399,12 @@ def load_config(config_path: Optional[Path] = None) -> MarkdownToDocxConfig:
     return MarkdownToDocxConfig.from_dict(merged)
 
 
+# Shared default section instances reused by from_dict when a section is
+# absent; frozen dataclasses make sharing across configs safe
+_DEFAULT_PANDOC = PandocConfig()
+_DEFAULT_TEMPLATE = TemplateConfig()
+_DEFAULT_CONVERSION = ConversionConfig()
+_DEFAULT_LOGGING = LoggingConfig()
+
 # Global default configuration instance
 DEFAULT_CONFIG = MarkdownToDocxConfig()
@@ -8,7 +8,16 @@ from __future__ import annotations
 
 
 class MarkdownToDocxError(Exception):
-    """Base exception for all markdown2docx related errors."""
+    """Base exception for all markdown2docx related errors.
+
+    Detail strings are formatted lazily: exceptions that are raised and
+    handled without ever being logged or printed never pay for the string
+    construction. The __slots__ declarations document each class's fixed
+    attribute set; they do not save the per-instance __dict__, which
+    Exception itself (having no __slots__) always carries.
+    """
+
+    __slots__ = ("message", "_details")
 
     def __init__(self, message: str, details: str | None = None) -> None:
         """Initialize the exception with message and optional details.
@@ -19,18 +28,36 @@ class MarkdownToDocxError(Exception):
         """
         super().__init__(message)
         self.message = message
-        self.details = details
+        self._details = details
+
+    @property
+    def details(self) -> str | None:
+        """Additional details about the error, built on first access."""
+        if self._details is None:
+            self._details = self._build_details()
+        return self._details
+
+    @details.setter
+    def details(self, value: str | None) -> None:
+        self._details = value
+
+    def _build_details(self) -> str | None:
+        """Format the detail string; subclasses override to defer the work."""
+        return None
 
     def __str__(self) -> str:
         """Return a formatted error message."""
-        if self.details:
-            return f"{self.message}\nDetails: {self.details}"
+        details = self.details
+        if details:
+            return f"{self.message}\nDetails: {details}"
         return self.message
 
 
 class PandocError(MarkdownToDocxError):
     """Raised when Pandoc-related operations fail."""
 
+    __slots__ = ("pandoc_version", "command")
+
     def __init__(
         self,
         message: str,
@@ -44,31 +71,44 @@ class PandocError(MarkdownToDocxError):
             pandoc_version: Version of Pandoc that caused the error
             command: The Pandoc command that failed
         """
-        details = []
-        if pandoc_version:
-            details.append(f"Pandoc version: {pandoc_version}")
-        if command:
-            details.append(f"Failed command: {command}")
-
-        super().__init__(message, "; ".join(details) if details else None)
+        super().__init__(message)
         self.pandoc_version = pandoc_version
         self.command = command
 
+    def _build_details(self) -> str | None:
+        # Common case: no context was supplied, so skip the list build
+        if self.pandoc_version is None and self.command is None:
+            return None
+        details = []
+        if self.pandoc_version:
+            details.append(f"Pandoc version: {self.pandoc_version}")
+        if self.command:
+            details.append(f"Failed command: {self.command}")
+        return "; ".join(details) if details else None
+
 
 class PandocNotFoundError(PandocError):
     """Raised when Pandoc is not installed or not found in PATH."""
 
+    __slots__ = ()
+
+    _MESSAGE = (
+        "Pandoc not found. Please install Pandoc or call pypandoc.download_pandoc()."
+    )
+    _DETAILS = "Visit https://pandoc.org/installing.html for installation instructions"
+
     def __init__(self) -> None:
-        message = "Pandoc not found. Please install Pandoc or call pypandoc.download_pandoc()."
-        super().__init__(message)
-        self.details = (
-            "Visit https://pandoc.org/installing.html for installation instructions"
-        )
+        super().__init__(self._MESSAGE)
+
+    def _build_details(self) -> str:
+        return self._DETAILS
 
 
 class ConversionError(MarkdownToDocxError):
     """Raised when markdown to DOCX conversion fails."""
 
+    __slots__ = ("input_file", "original_error")
+
     def __init__(
         self, input_file: str, message: str, original_error: Exception | None = None
     ) -> None:
@@ -79,20 +119,25 @@ class ConversionError(MarkdownToDocxError):
             message: Description of the conversion error
             original_error: The original exception that caused this error
         """
-        details = f"Input file: {input_file}"
-        if original_error:
-            details += (
-                f"; Original error: {type(original_error).__name__}: {original_error}"
-            )
-
-        super().__init__(message, details)
+        super().__init__(message)
         self.input_file = input_file
         self.original_error = original_error
 
+    def _build_details(self) -> str:
+        details = f"Input file: {self.input_file}"
+        if self.original_error:
+            details += (
+                f"; Original error: "
+                f"{type(self.original_error).__name__}: {self.original_error}"
+            )
+        return details
+
 
 class TemplateError(MarkdownToDocxError):
     """Raised when template-related operations fail."""
 
+    __slots__ = ("template_path",)
+
     def __init__(self, template_path: str | None, message: str) -> None:
         """Initialize template error with template path info.
 
@@ -100,14 +145,20 @@ class TemplateError(MarkdownToDocxError):
             template_path: Path to the template that caused the error
             message: Description of the template error
         """
-        details = f"Template path: {template_path}" if template_path else None
-        super().__init__(message, details)
+        super().__init__(message)
         self.template_path = template_path
 
+    def _build_details(self) -> str | None:
+        if self.template_path:
+            return f"Template path: {self.template_path}"
+        return None
+
 
 class ValidationError(MarkdownToDocxError):
     """Raised when DOCX validation fails."""
 
+    __slots__ = ("output_file", "validation_errors")
+
     def __init__(self, output_file: str, validation_errors: list[str]) -> None:
         """Initialize validation error with file and validation details.
 
@@ -115,17 +166,19 @@ class ValidationError(MarkdownToDocxError):
             output_file: Path to the output file that failed validation
             validation_errors: List of validation error messages
         """
-        message = f"DOCX validation failed for {output_file}"
-        details = "Validation errors: " + "; ".join(validation_errors)
-
-        super().__init__(message, details)
+        super().__init__(f"DOCX validation failed for {output_file}")
         self.output_file = output_file
         self.validation_errors = validation_errors
 
+    def _build_details(self) -> str:
+        return "Validation errors: " + "; ".join(self.validation_errors)
+
 
 class ConfigurationError(MarkdownToDocxError):
     """Raised when configuration is invalid or missing."""
 
+    __slots__ = ("config_key",)
+
     def __init__(self, config_key: str | None, message: str) -> None:
         """Initialize configuration error with key info.
 
@@ -133,6 +186,10 @@ class ConfigurationError(MarkdownToDocxError):
             config_key: The configuration key that caused the error
             message: Description of the configuration error
         """
-        details = f"Configuration key: {config_key}" if config_key else None
-        super().__init__(message, details)
+        super().__init__(message)
         self.config_key = config_key
+
+    def _build_details(self) -> str | None:
+        if self.config_key:
+            return f"Configuration key: {self.config_key}"
+        return None
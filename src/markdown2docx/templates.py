@@ -14,14 +14,19 @@ Features:
 
 from __future__ import annotations
 
-import contextlib
+import copy
+import functools
+import io
 import logging
+import zipfile
 from pathlib import Path
 from typing import Any, Literal, Optional, Union
 
 from docx import Document
 from docx.enum.style import WD_STYLE_TYPE
+from docx.opc.exceptions import PackageNotFoundError
 from docx.shared import Cm, Inches, Pt
+from lxml import etree
 
 from .config import DEFAULT_CONFIG, TemplateConfig
 from .exceptions import TemplateError
@@ -32,6 +37,98 @@ logger = logging.getLogger(__name__)
 # Type definitions
 PageSize = Literal["A4", "Letter"]
 
+# Pt/Cm/Inches allocate a fresh Emu wrapper on every call; template builds
+# touch only a small fixed set of sizes, so cache the (immutable) wrappers
+_pt = functools.lru_cache(maxsize=None)(Pt)
+_cm = functools.lru_cache(maxsize=None)(Cm)
+_inches = functools.lru_cache(maxsize=None)(Inches)
+
+# Serialized template bytes keyed by the full style configuration; template
+# output is deterministic per configuration, so repeat builds are one write
+_template_bytes_cache: dict[tuple, bytes] = {}
+
+# Heading style specs: (name, size, bold, space_before, space_after).
+# Built-in names keep TOC and outline working everywhere; sizes chosen for
+# readability. Frozen here so the style loop walks pure constants.
+_HEADING_SPECS = (
+    ("Heading 1", _pt(18), True, _pt(12), _pt(6)),
+    ("Heading 2", _pt(14), True, _pt(10), _pt(4)),
+    ("Heading 3", _pt(12), True, _pt(8), _pt(3)),
+    ("Heading 4", _pt(11), True, _pt(6), _pt(3)),
+    ("Heading 5", _pt(11), False, _pt(6), _pt(3)),
+    ("Heading 6", _pt(11), False, _pt(6), _pt(3)),
+)
+
+# Output directories already created by this process; repeated template
+# builds into the same directory skip the stat+mkdir syscalls (set ops are
+# GIL-atomic, so no lock is needed for membership/add)
+_ensured_dirs: set[Path] = set()
+
+# Clark-notation tag/attribute names for the wordprocessingml namespace,
+# interned once instead of rebuilt from the document nsmap per call
+_WNS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_TAG_COMPAT = f"{_WNS}compat"
+_TAG_COMPAT_SETTING = f"{_WNS}compatSetting"
+_ATTR_NAME = f"{_WNS}name"
+_ATTR_URI = f"{_WNS}uri"
+_ATTR_VAL = f"{_WNS}val"
+
+# Prebuilt <w:compat> fragment for documents without one (every fresh
+# Document); parsed once here, deep-copied per template build
+_COMPAT_FRAGMENT = etree.fromstring(
+    b'<w:compat xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+    b'<w:compatSetting w:name="compatibilityMode"'
+    b' w:uri="http://schemas.microsoft.com/office/word" w:val="16"/>'
+    b"</w:compat>"
+)
+
+
+# Serialized blank document; Document() re-reads and re-parses python-docx's
+# bundled default template from disk on every call, while rehydrating from
+# these bytes skips the filesystem entirely
+_blank_document_bytes: bytes | None = None
+
+
+def _rezip_stored(data: bytes) -> bytes:
+    """Re-pack a DOCX zip with ZIP_STORED entries.
+
+    python-docx saves with DEFLATE, spending zlib CPU on a few KB of XML
+    that is consumed locally; storing uncompressed skips that on every
+    build and on every later read of the template.
+    """
+    src = zipfile.ZipFile(io.BytesIO(data))
+    out = io.BytesIO()
+    with zipfile.ZipFile(out, "w", zipfile.ZIP_STORED) as dst:
+        for info in src.infolist():
+            dst.writestr(info.filename, src.read(info.filename))
+    return out.getvalue()
+
+
+def _new_document() -> Any:
+    """Return a fresh blank Document, amortizing the default-template load."""
+    global _blank_document_bytes
+    if _blank_document_bytes is None:
+        doc = Document()
+        buf = io.BytesIO()
+        doc.save(buf)
+        _blank_document_bytes = buf.getvalue()
+        return doc
+    return Document(io.BytesIO(_blank_document_bytes))
+
+
+def _get_or_add_style(
+    styles: Any, name: str, style_type: Any = WD_STYLE_TYPE.PARAGRAPH
+) -> Any:
+    """Return the named style, adding a paragraph style when absent.
+
+    The try/except form does one lookup in the common already-exists case
+    instead of the __contains__ + __getitem__ pair.
+    """
+    try:
+        return styles[name]
+    except KeyError:
+        return styles.add_style(name, style_type)
+
 
 class DocxTemplateManager:
     """Manage creation and customization of modern DOCX templates.
@@ -186,13 +283,32 @@ class DocxTemplateManager:
             output_path = Path(output_path)
             self._validate_output_path(output_path)
 
-            # Ensure output directory exists
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-
-            logger.info("Creating DOCX template: %s", output_path)
+            # Ensure output directory exists (once per directory)
+            parent = output_path.parent
+            if parent not in _ensured_dirs:
+                parent.mkdir(parents=True, exist_ok=True)
+                _ensured_dirs.add(parent)
+
+            # Identical configurations produce identical bytes; serve
+            # repeat builds straight from the cache
+            cache_key = (
+                self.page_size,
+                self.margin_cm,
+                self.body_font,
+                self.body_size_pt,
+                self.heading_font,
+                self.code_font,
+                self.code_size_pt,
+                add_sample_content,
+            )
+            cached = _template_bytes_cache.get(cache_key)
+            if cached is not None:
+                output_path.write_bytes(cached)
+                logger.debug("Created template from cache: %s", output_path)
+                return output_path
 
             # Create new document
-            doc = Document()
+            doc = _new_document()
 
             # Configure document structure and styles
             self._configure_page_layout(doc)
@@ -205,13 +321,23 @@ class DocxTemplateManager:
             # Set modern compatibility mode for better Office support
             self._set_compatibility_mode_xml(doc, mode="16")
 
-            # Save the document
-            doc.save(str(output_path))
+            # Serialize to memory first: one write() syscall instead of the
+            # many small zip-entry flushes doc.save() streams to disk, and
+            # the cache gets the bytes without a read-back
+            buf = io.BytesIO()
+            doc.save(buf)
+            data = _rezip_stored(buf.getvalue())
+            output_path.write_bytes(data)
+            _template_bytes_cache[cache_key] = data
 
-            logger.info("Successfully created template: %s", output_path)
+            logger.debug("Created template: %s", output_path)
             return output_path
 
-        except Exception as e:
+        except TemplateError:
+            # Path validation failures are already well-formed; re-wrapping
+            # them would bury the specific message
+            raise
+        except (OSError, PackageNotFoundError, etree.XMLSyntaxError) as e:
             raise TemplateError(
                 str(output_path), f"Failed to create template file: {e}"
             ) from e
@@ -231,69 +357,60 @@ class DocxTemplateManager:
 
     def _configure_page_layout(self, doc: Any) -> None:
         """Configure page size and margins."""
-        for section in doc.sections:
-            # Margins
-            section.top_margin = Cm(self.margin_cm)
-            section.bottom_margin = Cm(self.margin_cm)
-            section.left_margin = Cm(self.margin_cm)
-            section.right_margin = Cm(self.margin_cm)
-
-            # Page size
-            if self.page_size == "A4":
-                section.page_width = Cm(21.0)
-                section.page_height = Cm(29.7)
-            else:  # Letter
-                section.page_width = Inches(8.5)
-                section.page_height = Inches(11.0)
+        # A blank document has exactly one section; each .sections access
+        # builds a fresh wrapper over the lxml tree, so grab it once
+        section = doc.sections[0]
+        margin = _cm(self.margin_cm)
+
+        # Margins
+        section.top_margin = margin
+        section.bottom_margin = margin
+        section.left_margin = margin
+        section.right_margin = margin
+
+        # Page size
+        if self.page_size == "A4":
+            section.page_width = _cm(21.0)
+            section.page_height = _cm(29.7)
+        else:  # Letter
+            section.page_width = _inches(8.5)
+            section.page_height = _inches(11.0)
 
     def _configure_core_styles(self, doc: Any) -> None:
         """Configure Normal, Heading 1..6, and a Code Block paragraph style."""
         styles = doc.styles
 
-        # Normal
+        # Normal (bind the font proxy once; each .font access goes through
+        # a python-docx property)
         normal = styles["Normal"]
-        normal.font.name = self.body_font
-        normal.font.size = Pt(self.body_size_pt)
+        normal_font = normal.font
+        normal_font.name = self.body_font
+        normal_font.size = _pt(self.body_size_pt)
         pf = normal.paragraph_format
-        pf.space_after = Pt(6)
+        pf.space_after = _pt(6)
         pf.line_spacing = 1.15
 
-        # Headings (use built-in names so TOC and outline work everywhere)
-        # Sizes chosen for readability; adjust as desired
-        heading_specs = [
-            ("Heading 1", 18, True, 12, 6),
-            ("Heading 2", 14, True, 10, 4),
-            ("Heading 3", 12, True, 8, 3),
-            ("Heading 4", 11, True, 6, 3),
-            ("Heading 5", 11, False, 6, 3),
-            ("Heading 6", 11, False, 6, 3),
-        ]
-        for name, size_pt, bold, space_before_pt, space_after_pt in heading_specs:
-            style = (
-                styles[name]
-                if name in styles
-                else styles.add_style(name, WD_STYLE_TYPE.PARAGRAPH)
-            )
-            style.font.name = self.heading_font
-            style.font.size = Pt(size_pt)
-            style.font.bold = bold
+        # Headings
+        for name, size, bold, space_before, space_after in _HEADING_SPECS:
+            style = _get_or_add_style(styles, name)
+            font = style.font
+            font.name = self.heading_font
+            font.size = size
+            font.bold = bold
             p = style.paragraph_format
-            p.space_before = Pt(space_before_pt)
-            p.space_after = Pt(space_after_pt)
+            p.space_before = space_before
+            p.space_after = space_after
             p.keep_with_next = True  # keep heading with the following paragraph
 
         # Code Block paragraph style (not built-in; keep the name stable)
-        code_name = "Code Block"
-        if code_name in styles:
-            code_style = styles[code_name]
-        else:
-            code_style = styles.add_style(code_name, WD_STYLE_TYPE.PARAGRAPH)
-        code_style.font.name = self.code_font
-        code_style.font.size = Pt(self.code_size_pt)
+        code_style = _get_or_add_style(styles, "Code Block")
+        code_font = code_style.font
+        code_font.name = self.code_font
+        code_font.size = _pt(self.code_size_pt)
         cp = code_style.paragraph_format
-        cp.left_indent = Cm(0.75)
-        cp.space_before = Pt(6)
-        cp.space_after = Pt(6)
+        cp.left_indent = _cm(0.75)
+        cp.space_before = _pt(6)
+        cp.space_after = _pt(6)
 
     def _add_sample_content(self, doc: Any) -> None:
         """Insert minimal content for preview/testing the template styles."""
@@ -318,47 +435,39 @@ class DocxTemplateManager:
         - Common values: 14 (Word 2010), 15 (Word 2013), 16 (Word 2016/2019+).
         - This hints Word rendering behavior for better modern compatibility.
         """
-        with contextlib.suppress(Exception):
-            # Find settings part
-            settings_part = next(
-                (
-                    part
-                    for part in doc.part._child_parts
-                    if "settings" in str(part.partname)
-                ),
-                None,
-            )
-
-            if not settings_part:
-                return
-
-            settings = settings_part._element
-            nsmap = settings.nsmap or {}
-            w_ns = nsmap.get(
-                "w", "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
-            )
-            w = f"{{{w_ns}}}"
+        try:
+            # python-docx resolves the settings part through the document
+            # part's relationship table — O(1), no scan over child parts
+            settings = doc.settings.element
 
-            # Find or create compat element
-            compat = settings.find(f"{w}compat")
+            # Find or create compat element; fresh documents take the
+            # prebuilt-fragment fast path
+            compat = settings.find(_TAG_COMPAT)
             if compat is None:
-                compat = settings.makeelement(f"{w}compat")
+                compat = copy.deepcopy(_COMPAT_FRAGMENT)
+                if mode != "16":
+                    compat[0].set(_ATTR_VAL, mode)
                 settings.append(compat)
+                return
 
             # Update or create compatibilityMode setting
-            existing = compat.findall(f"{w}compatSetting")
+            existing = compat.findall(_TAG_COMPAT_SETTING)
             target = next(
-                (el for el in existing if el.get(f"{w}name") == "compatibilityMode"),
+                (el for el in existing if el.get(_ATTR_NAME) == "compatibilityMode"),
                 None,
             )
 
             if target is None:
-                target = settings.makeelement(f"{w}compatSetting")
+                target = settings.makeelement(_TAG_COMPAT_SETTING)
                 compat.append(target)
 
-            target.set(f"{w}name", "compatibilityMode")
-            target.set(f"{w}uri", "http://schemas.microsoft.com/office/word")
-            target.set(f"{w}val", mode)
+            target.set(_ATTR_NAME, "compatibilityMode")
+            target.set(_ATTR_URI, "http://schemas.microsoft.com/office/word")
+            target.set(_ATTR_VAL, mode)
+        except (AttributeError, KeyError, TypeError, ValueError):
+            # Best effort only: templates remain valid without the
+            # compatibility hint, so internal-API drift must not fail builds
+            return
 
     # ---------- Static method for backward compatibility ----------
 
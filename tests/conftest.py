@@ -0,0 +1,106 @@
+"""Shared fixtures for the markdown2docx test suite."""
+
+import io
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from markdown2docx.templates import DocxTemplateManager
+
+
+def _minimal_docx_bytes():
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as stub:
+        stub.writestr("[Content_Types].xml", "<Types/>")
+        stub.writestr("_rels/.rels", "<Relationships/>")
+        stub.writestr("word/document.xml", "<document/>")
+    return buf.getvalue()
+
+
+# Smallest zip that passes _validate_docx_output's structure checks;
+# built once per session and written by the conversion stub below
+MINIMAL_DOCX_BYTES = _minimal_docx_bytes()
+
+# Word's built-in heading style names; set membership replaces the
+# per-paragraph substring scan over lowercased style names
+HEADING_STYLES = frozenset(f"Heading {i}" for i in range(1, 10))
+
+
+def pytest_addoption(parser):
+    """Register the opt-in flag for slow breadth tests."""
+    parser.addoption(
+        "--runslow",
+        action="store_true",
+        default=False,
+        help="run tests marked slow",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip slow-marked tests unless --runslow was passed."""
+    if config.getoption("--runslow"):
+        return
+    skip_slow = pytest.mark.skip(reason="needs --runslow option to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+@pytest.fixture(autouse=True)
+def _fast_pandoc_version(request, monkeypatch):
+    """Stub the pandoc version probe unless a test opts into the real binary.
+
+    Every converter construction shells out to pandoc to read its version;
+    stubbing the probe suite-wide removes one subprocess per instantiation.
+    Tests marked ``@pytest.mark.real_pandoc`` keep the real probe.
+    """
+    if "real_pandoc" in request.keywords:
+        return
+    monkeypatch.setattr(
+        "markdown2docx.converter.pypandoc.get_pandoc_version", lambda: "2.19.2"
+    )
+
+
+@pytest.fixture(autouse=True)
+def _mock_pandoc_convert(request, monkeypatch):
+    """Stub pypandoc.convert_file suite-wide; real runs opt out via marker.
+
+    Most tests only need an output file that passes structural validation,
+    not a genuine pandoc run. Tests that inspect converted content mark
+    themselves ``no_mock_pandoc`` (or ``real_pandoc``) to keep the real
+    pipeline; tests that patch convert_file themselves simply override
+    this stub.
+    """
+    keywords = request.keywords
+    if "no_mock_pandoc" in keywords or "real_pandoc" in keywords:
+        return
+
+    def fake_convert(source, *args, **kwargs):
+        Path(kwargs["outputfile"]).write_bytes(MINIMAL_DOCX_BYTES)
+        return ""
+
+    monkeypatch.setattr(
+        "markdown2docx.converter.pypandoc.convert_file", fake_convert
+    )
+
+
+@pytest.fixture(scope="session")
+def modern_template(tmp_path_factory):
+    """Single modern template shared by tests that only consume it."""
+    path = tmp_path_factory.mktemp("templates") / "template.docx"
+    DocxTemplateManager.create_modern_template(path)
+    return path
+
+
+@pytest.fixture(scope="session")
+def modern_template_with_sample(tmp_path_factory):
+    """Modern template with sample content, shared by read-only style tests.
+
+    Template synthesis (style building plus zip writing) dominates the
+    template tests, so it runs once per session; tests that need custom
+    creation arguments still build their own.
+    """
+    path = tmp_path_factory.mktemp("templates") / "template_sample.docx"
+    DocxTemplateManager.create_modern_template(path, add_sample=True)
+    return path
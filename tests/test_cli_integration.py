@@ -0,0 +1,41 @@
+"""True end-to-end CLI integration test.
+
+One subprocess run through the installed entry-point wiring and a real
+pandoc conversion. Deselected from the default run; execute with
+``pytest -m integration``.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+pytestmark = pytest.mark.integration
+
+
+@pytest.mark.real_pandoc
+def test_cli_subprocess_end_to_end(tmp_path):
+    """Test a full conversion through a fresh interpreter, no mocks."""
+    input_file = tmp_path / "doc.md"
+    input_file.write_text("# Title\n\n## Section\n\nBody content.\n")
+    output_file = tmp_path / "doc.docx"
+
+    repo_root = Path(__file__).resolve().parent.parent
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "src.markdown2docx.cli",
+            str(input_file),
+            "-o",
+            str(output_file),
+        ],
+        cwd=repo_root,
+        capture_output=True,
+        text=True,
+    )
+
+    assert result.returncode == 0
+    assert "Successfully converted" in result.stdout
+    assert output_file.exists()
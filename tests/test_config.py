@@ -22,57 +22,34 @@ from markdown2docx.exceptions import ConfigurationError
 class TestEnvironmentVariableParsing:
     """Test environment variable parsing functionality."""
 
-    def test_parse_env_value_boolean_true(self):
-        """Test parsing boolean true values."""
-        true_values = [
-            "true",
-            "True",
-            "TRUE",
-            "yes",
-            "Yes",
-            "YES",
-            "1",
-            "on",
-            "On",
-            "ON",
-        ]
-        for value in true_values:
-            assert _parse_env_value(value) is True
-
-    def test_parse_env_value_boolean_false(self):
-        """Test parsing boolean false values."""
-        false_values = [
-            "false",
-            "False",
-            "FALSE",
-            "no",
-            "No",
-            "NO",
-            "0",
-            "off",
-            "Off",
-            "OFF",
-        ]
-        for value in false_values:
-            assert _parse_env_value(value) is False
-
-    def test_parse_env_value_integer(self):
-        """Test parsing integer values."""
-        assert _parse_env_value("42") == 42
-        assert _parse_env_value("-10") == -10
-        assert _parse_env_value("0") == 0
-
-    def test_parse_env_value_float(self):
-        """Test parsing float values."""
-        assert _parse_env_value("3.14") == 3.14
-        assert _parse_env_value("-2.5") == -2.5
-        assert _parse_env_value("0.0") == 0.0
-
-    def test_parse_env_value_string(self):
-        """Test parsing string values."""
-        assert _parse_env_value("hello") == "hello"
-        assert _parse_env_value("path/to/file") == "path/to/file"
-        assert _parse_env_value("") == ""
+    @pytest.mark.parametrize(
+        ("raw", "expected"),
+        [
+            # Booleans (all accepted spellings)
+            *[(v, True) for v in ("true", "True", "TRUE", "yes", "Yes", "YES",
+                                  "1", "on", "On", "ON")],
+            *[(v, False) for v in ("false", "False", "FALSE", "no", "No", "NO",
+                                   "0", "off", "Off", "OFF")],
+            # Integers
+            ("42", 42),
+            ("-10", -10),
+            # Floats
+            ("3.14", 3.14),
+            ("-2.5", -2.5),
+            ("0.0", 0.0),
+            # Strings
+            ("hello", "hello"),
+            ("path/to/file", "path/to/file"),
+            ("", ""),
+        ],
+    )
+    def test_parse_env_value(self, raw, expected):
+        """Test value parsing across boolean, numeric, and string inputs."""
+        result = _parse_env_value(raw)
+        if isinstance(expected, bool):
+            assert result is expected
+        else:
+            assert result == expected
 
 
 class TestMarkdownToDocxConfigFromEnv:
@@ -88,55 +65,43 @@ class TestMarkdownToDocxConfigFromEnv:
             assert isinstance(config.conversion, ConversionConfig)
             assert isinstance(config.logging, LoggingConfig)
 
-    def test_from_env_pandoc_settings(self):
-        """Test parsing Pandoc-related environment variables."""
-        env_vars = {
-            "MD2DOCX_PANDOC__MIN_VERSION": "2.19.0",
-            "MD2DOCX_PANDOC__TIMEOUT_SECONDS": "300",
-        }
-
-        with patch.dict(os.environ, env_vars, clear=True):
-            config = MarkdownToDocxConfig.from_env()
-            assert config.pandoc.min_version == "2.19.0"
-            assert config.pandoc.timeout_seconds == 300
-
-    def test_from_env_template_settings(self):
-        """Test parsing template-related environment variables."""
-        env_vars = {
-            "MD2DOCX_TEMPLATE__BODY_FONT": "Arial",
-            "MD2DOCX_TEMPLATE__BODY_SIZE_PT": "12",
-            "MD2DOCX_TEMPLATE__MARGIN_CM": "3.0",
-        }
-
-        with patch.dict(os.environ, env_vars, clear=True):
-            config = MarkdownToDocxConfig.from_env()
-            assert config.template.body_font == "Arial"
-            assert config.template.body_size_pt == 12
-            assert config.template.margin_cm == 3.0
-
-    def test_from_env_conversion_settings(self):
-        """Test parsing conversion-related environment variables."""
-        env_vars = {
-            "MD2DOCX_CONVERSION__DEFAULT_TOC_DEPTH": "4",
-            "MD2DOCX_CONVERSION__VALIDATE_OUTPUT": "false",
-        }
-
+    @pytest.mark.parametrize(
+        ("env_vars", "attr_path", "expected"),
+        [
+            ({"MD2DOCX_PANDOC__MIN_VERSION": "2.19.0"}, "pandoc.min_version", "2.19.0"),
+            ({"MD2DOCX_PANDOC__TIMEOUT_SECONDS": "300"}, "pandoc.timeout_seconds", 300),
+            ({"MD2DOCX_TEMPLATE__BODY_FONT": "Arial"}, "template.body_font", "Arial"),
+            ({"MD2DOCX_TEMPLATE__BODY_SIZE_PT": "12"}, "template.body_size_pt", 12),
+            ({"MD2DOCX_TEMPLATE__MARGIN_CM": "3.0"}, "template.margin_cm", 3.0),
+            (
+                {"MD2DOCX_CONVERSION__DEFAULT_TOC_DEPTH": "4"},
+                "conversion.default_toc_depth",
+                4,
+            ),
+            (
+                {"MD2DOCX_CONVERSION__VALIDATE_OUTPUT": "false"},
+                "conversion.validate_output",
+                False,
+            ),
+            ({"MD2DOCX_LOGGING__LEVEL": "DEBUG"}, "logging.level", "DEBUG"),
+            (
+                {"MD2DOCX_LOGGING__FORMAT": "%(levelname)s: %(message)s"},
+                "logging.format",
+                "%(levelname)s: %(message)s",
+            ),
+        ],
+    )
+    def test_from_env_setting(self, env_vars, attr_path, expected):
+        """Test parsing each section's environment variables."""
         with patch.dict(os.environ, env_vars, clear=True):
             config = MarkdownToDocxConfig.from_env()
-            assert config.conversion.default_toc_depth == 4
-            assert config.conversion.validate_output is False
 
-    def test_from_env_logging_settings(self):
-        """Test parsing logging-related environment variables."""
-        env_vars = {
-            "MD2DOCX_LOGGING__LEVEL": "DEBUG",
-            "MD2DOCX_LOGGING__FORMAT": "%(levelname)s: %(message)s",
-        }
-
-        with patch.dict(os.environ, env_vars, clear=True):
-            config = MarkdownToDocxConfig.from_env()
-            assert config.logging.level == "DEBUG"
-            assert config.logging.format == "%(levelname)s: %(message)s"
+        section, attr = attr_path.split(".")
+        value = getattr(getattr(config, section), attr)
+        if isinstance(expected, bool):
+            assert value is expected
+        else:
+            assert value == expected
 
     def test_from_env_mixed_settings(self):
         """Test parsing mixed environment variables."""
@@ -281,9 +246,11 @@ class TestLoadConfig:
         config = load_config(nonexistent_path)
         assert isinstance(config, MarkdownToDocxConfig)
 
-    def test_load_config_existing_file(self):
+    def test_load_config_existing_file(self, tmp_path):
         """Test loading config from TOML file and env override precedence."""
-        config_toml = b"""
+        config_path = tmp_path / "config.toml"
+        config_path.write_bytes(
+            b"""
 [pandoc]
 min_version = "2.22"
 timeout_seconds = 120
@@ -292,28 +259,22 @@ timeout_seconds = 120
 default_toc = true
 default_toc_depth = 5
 """
-        with tempfile.NamedTemporaryFile(suffix=".toml", delete=False) as tmp:
-            tmp.write(config_toml)
-            tmp.flush()
-            config_path = Path(tmp.name)
+        )
 
-            try:
-                with patch.dict(
-                    os.environ,
-                    {
-                        "MD2DOCX_LOGGING__LEVEL": "DEBUG",
-                        "MD2DOCX_PANDOC__TIMEOUT_SECONDS": "180",
-                    },
-                    clear=True,
-                ):
-                    config = load_config(config_path)
-                    assert config.pandoc.min_version == "2.22"
-                    assert config.pandoc.timeout_seconds == 180
-                    assert config.conversion.default_toc is True
-                    assert config.conversion.default_toc_depth == 5
-                    assert config.logging.level == "DEBUG"
-            finally:
-                config_path.unlink()
+        with patch.dict(
+            os.environ,
+            {
+                "MD2DOCX_LOGGING__LEVEL": "DEBUG",
+                "MD2DOCX_PANDOC__TIMEOUT_SECONDS": "180",
+            },
+            clear=True,
+        ):
+            config = load_config(config_path)
+            assert config.pandoc.min_version == "2.22"
+            assert config.pandoc.timeout_seconds == 180
+            assert config.conversion.default_toc is True
+            assert config.conversion.default_toc_depth == 5
+            assert config.logging.level == "DEBUG"
 
     def test_load_config_existing_yaml_file(self):
         """Test loading config from YAML file."""
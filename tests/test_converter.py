@@ -3,18 +3,22 @@
 包含基本转换功能测试和扩展功能测试。
 """
 
-import sys
+import base64
+import json
+import os
 import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from unittest.mock import Mock, patch
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from conftest import MINIMAL_DOCX_BYTES
 
 from markdown2docx.config import MarkdownToDocxConfig
-from markdown2docx.converter import MarkdownToDocxConverter
+from markdown2docx.converter import MarkdownToDocxConverter, _pandoc_version
 from markdown2docx.exceptions import (
     ConversionError,
     PandocError,
@@ -24,10 +28,16 @@ from markdown2docx.exceptions import (
 from markdown2docx.templates import DocxTemplateManager
 
 
-@pytest.fixture
-def sample_markdown():
-    """Sample markdown content with modern features (包含现代功能的示例Markdown内容)."""
-    return """# Test Document 测试文档
+@pytest.fixture(autouse=True)
+def clear_pandoc_version_cache():
+    """Clear the cached pandoc version so mocked versions don't leak between tests."""
+    _pandoc_version.cache_clear()
+    yield
+    _pandoc_version.cache_clear()
+
+
+# Sample markdown content with modern features (包含现代功能的示例Markdown内容)
+_SAMPLE_MARKDOWN = """# Test Document 测试文档
 
 This is a **test** document with modern markdown features:
 这是一个包含现代Markdown功能的**测试**文档：
@@ -76,70 +86,146 @@ This has a footnote[^1]. 这里有一个脚注[^1]。
 [^1]: This is the footnote content. 这是脚注内容。
 """
 
+# Encoded once at import; the bilingual sample makes per-test UTF-8
+# encoding measurable when permutations multiply
+_SAMPLE_MARKDOWN_BYTES = _SAMPLE_MARKDOWN.encode("utf-8")
+
 
 @pytest.fixture
+def mock_pandoc(monkeypatch):
+    """Stub out the pandoc binary for tests that never read the DOCX content.
+
+    Patches the version probe and convert_file so neither shells out;
+    the fake conversion writes a structurally valid stub DOCX. Returns the
+    list of convert_file keyword-argument dicts for argument assertions.
+    """
+    calls = []
+
+    def fake_convert(source, *args, **kwargs):
+        calls.append(kwargs)
+        Path(kwargs["outputfile"]).write_bytes(MINIMAL_DOCX_BYTES)
+        return ""
+
+    monkeypatch.setattr(
+        "markdown2docx.converter.pypandoc.get_pandoc_version", lambda: "3.1.9"
+    )
+    monkeypatch.setattr(
+        "markdown2docx.converter.pypandoc.convert_file", fake_convert
+    )
+    return calls
+
+
+@pytest.fixture(scope="session")
 def converter():
-    """Converter instance (转换器实例)."""
-    return MarkdownToDocxConverter()
+    """Converter instance, shared by tests that use it read-only (转换器实例).
+
+    Each construction probes the pandoc binary for its version; one
+    instance per session collapses those probes. Tests that exercise
+    initialization or mutate state construct their own converter.
+
+    Session fixtures are built before the function-scoped autouse version
+    stub from conftest, so stub the probe here for the construction.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            "markdown2docx.converter.pypandoc.get_pandoc_version",
+            lambda: "2.19.2",
+        )
+        return MarkdownToDocxConverter()
+
+
+@pytest.fixture(scope="session")
+def sample_markdown_file(tmp_path_factory):
+    """Sample markdown written to disk once; tests hardlink it into place.
+
+    os.link is an inode-table operation, so per-test "copies" cost no
+    data I/O and the content is written exactly once per session.
+    """
+    path = tmp_path_factory.mktemp("fixtures") / "sample.md"
+    path.write_bytes(_SAMPLE_MARKDOWN_BYTES)
+    return path
+
+
+@pytest.fixture(scope="session")
+def baseline_docx(sample_markdown_file):
+    """One real sample conversion shared by tests that only inspect the artifact."""
+    return MarkdownToDocxConverter().convert(
+        sample_markdown_file, sample_markdown_file.with_suffix(".docx")
+    )
 
 
 # ============================================================================
 # Basic Conversion Tests
 # ============================================================================
 
-def test_convert_basic(converter, sample_markdown):
+@pytest.mark.real_pandoc
+def test_convert_basic(baseline_docx):
     """Test basic conversion functionality (测试基本转换功能)."""
-    with TemporaryDirectory() as tmpdir:
-        input_path = Path(tmpdir) / "test.md"
-        input_path.write_text(sample_markdown)
+    assert baseline_docx.exists()
+    assert baseline_docx.suffix == ".docx"
 
-        output_path = converter.convert(input_path)
 
-        assert output_path.exists()
-        assert output_path.suffix == ".docx"
-
-
-def test_convert_with_custom_output(converter, sample_markdown):
+def test_convert_with_custom_output(mock_pandoc, sample_markdown_file, tmp_path):
     """Test conversion with custom output path (测试自定义输出路径的转换)."""
-    with TemporaryDirectory() as tmpdir:
-        input_path = Path(tmpdir) / "test.md"
-        output_path = Path(tmpdir) / "custom.docx"
-        input_path.write_text(sample_markdown)
+    # Construct locally: the session converter is built before the
+    # function-scoped pandoc stub is in place
+    converter = MarkdownToDocxConverter()
+    input_path = tmp_path / "test.md"
+    output_path = tmp_path / "custom.docx"
+    os.link(sample_markdown_file, input_path)
 
-        result = converter.convert(input_path, output_path)
+    result = converter.convert(input_path, output_path)
 
-        assert result == output_path
-        assert output_path.exists()
+    assert result == output_path
+    assert output_path.exists()
 
 
-def test_convert_with_options(converter, sample_markdown):
+def test_convert_with_options(mock_pandoc, sample_markdown_file, tmp_path):
     """Test conversion with pandoc options (测试带Pandoc选项的转换)."""
-    with TemporaryDirectory() as tmpdir:
-        input_path = Path(tmpdir) / "test.md"
-        input_path.write_text(sample_markdown)
+    converter = MarkdownToDocxConverter()
+    input_path = tmp_path / "test.md"
+    os.link(sample_markdown_file, input_path)
 
-        output_path = converter.convert(
-            input_path,
-            toc=True,
-            toc_depth=2,
-        )
+    output_path = converter.convert(
+        input_path,
+        toc=True,
+        toc_depth=2,
+    )
 
-        assert output_path.exists()
+    assert output_path.exists()
 
 
-def test_convert_with_template(converter, sample_markdown):
+def test_convert_with_template(mock_pandoc, sample_markdown_file, modern_template, tmp_path):
     """Test conversion with template (测试使用模板的转换)."""
-    with TemporaryDirectory() as tmpdir:
-        input_path = Path(tmpdir) / "test.md"
-        template_path = Path(tmpdir) / "template.docx"
-        input_path.write_text(sample_markdown)
+    converter = MarkdownToDocxConverter()
+    input_path = tmp_path / "test.md"
+    os.link(sample_markdown_file, input_path)
 
-        # Create a template first (首先创建模板)
-        DocxTemplateManager.create_modern_template(template_path)
+    output_path = converter.convert_with_template(input_path, modern_template)
 
-        output_path = converter.convert_with_template(input_path, template_path)
+    assert output_path.exists()
 
-        assert output_path.exists()
+
+def test_convert_text(monkeypatch, tmp_path):
+    """Test in-memory text conversion (测试内存文本转换)."""
+    calls = []
+
+    def fake_convert_text(text, *args, **kwargs):
+        calls.append(kwargs)
+        Path(kwargs["outputfile"]).write_bytes(MINIMAL_DOCX_BYTES)
+        return ""
+
+    monkeypatch.setattr(
+        "markdown2docx.converter.pypandoc.convert_text", fake_convert_text
+    )
+    converter = MarkdownToDocxConverter()
+    output_path = tmp_path / "out.docx"
+
+    result = converter.convert_text("# Title\n\nBody text.\n", output_path, toc=True)
+
+    assert result == output_path
+    assert output_path.exists()
+    assert "--toc" in calls[0]["extra_args"]
 
 
 def test_convert_nonexistent_file(converter):
@@ -191,33 +277,25 @@ def test_template_creation():
         assert template_path.exists()
 
 
-def test_converter_with_reference_doc(sample_markdown):
+def test_converter_with_reference_doc(modern_template):
     """Test converter initialization with reference document (测试使用参考文档初始化转换器)."""
-    with TemporaryDirectory() as tmpdir:
-        template_path = Path(tmpdir) / "template.docx"
-        DocxTemplateManager.create_modern_template(template_path)
+    converter = MarkdownToDocxConverter(reference_doc=modern_template)
+    assert converter.reference_doc == modern_template
 
-        converter = MarkdownToDocxConverter(reference_doc=template_path)
-        assert converter.reference_doc == template_path
 
-
-def test_convert_with_template_method(converter, sample_markdown):
+def test_convert_with_template_method(converter, sample_markdown_file, modern_template, tmp_path):
     """Test the convert_with_template method directly."""
-    with TemporaryDirectory() as tmpdir:
-        input_path = Path(tmpdir) / "test.md"
-        template_path = Path(tmpdir) / "template.docx"
-        output_path = Path(tmpdir) / "output.docx"
+    input_path = tmp_path / "test.md"
+    output_path = tmp_path / "output.docx"
+    os.link(sample_markdown_file, input_path)
 
-        input_path.write_text(sample_markdown)
-        DocxTemplateManager.create_modern_template(template_path)
+    # Test convert_with_template method
+    result = converter.convert_with_template(
+        input_path, modern_template, output_path, toc=True
+    )
 
-        # Test convert_with_template method
-        result = converter.convert_with_template(
-            input_path, template_path, output_path, toc=True
-        )
-
-        assert result == output_path
-        assert output_path.exists()
+    assert result == output_path
+    assert output_path.exists()
 
 
 # ============================================================================
@@ -233,27 +311,99 @@ class TestConverterInitialization:
         converter = MarkdownToDocxConverter(config=config)
         assert converter.config is config
 
-    def test_init_with_reference_doc(self):
+    def test_init_with_reference_doc(self, tmp_path):
         """Test converter initialization with reference document."""
-        with tempfile.NamedTemporaryFile(suffix=".docx", delete=False) as tmp:
-            ref_path = Path(tmp.name)
-            try:
-                converter = MarkdownToDocxConverter(reference_doc=ref_path)
-                assert converter.reference_doc == ref_path
-            finally:
-                ref_path.unlink()
+        ref_path = tmp_path / "reference.docx"
+        ref_path.touch()
+
+        converter = MarkdownToDocxConverter(reference_doc=ref_path)
+        assert converter.reference_doc == ref_path
 
-    def test_init_with_both_config_and_reference(self):
+    def test_init_with_both_config_and_reference(self, tmp_path):
         """Test converter initialization with both config and reference doc."""
         config = MarkdownToDocxConfig()
-        with tempfile.NamedTemporaryFile(suffix=".docx", delete=False) as tmp:
-            ref_path = Path(tmp.name)
-            try:
-                converter = MarkdownToDocxConverter(reference_doc=ref_path, config=config)
-                assert converter.config is config
-                assert converter.reference_doc == ref_path
-            finally:
-                ref_path.unlink()
+        ref_path = tmp_path / "reference.docx"
+        ref_path.touch()
+
+        converter = MarkdownToDocxConverter(reference_doc=ref_path, config=config)
+        assert converter.config is config
+        assert converter.reference_doc == ref_path
+
+    def test_use_server_without_executable_falls_back(self):
+        """Test that use_server degrades gracefully when pandoc-server is missing."""
+        config = MarkdownToDocxConfig.from_dict({"pandoc": {"use_server": True}})
+
+        with patch("markdown2docx.converter.pypandoc.get_pandoc_version") as mock_version:
+            mock_version.return_value = "3.1.9"
+            with patch("markdown2docx.converter.shutil.which", return_value=None):
+                converter = MarkdownToDocxConverter(config=config)
+
+        assert converter._server is None
+        assert converter._server_url is None
+
+
+# ============================================================================
+# Pandoc Server Conversion Tests
+# ============================================================================
+
+class TestPandocServerConversion:
+    """Test the pandoc-server conversion path against a stub HTTP server."""
+
+    @pytest.fixture
+    def stub_server(self):
+        """Local HTTP server that records request payloads and answers
+        with a base64-encoded stub DOCX, the way pandoc-server does."""
+        payloads = []
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                length = int(self.headers["Content-Length"])
+                payloads.append(json.loads(self.rfile.read(length)))
+                body = base64.b64encode(MINIMAL_DOCX_BYTES)
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                """Keep request logging out of the test output."""
+
+        server = HTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            yield f"http://127.0.0.1:{server.server_port}/", payloads
+        finally:
+            server.shutdown()
+            thread.join()
+
+    def test_convert_via_server_payload(self, stub_server, tmp_path):
+        """Test that server conversions succeed and send the documented fields."""
+        url, payloads = stub_server
+        template_path = tmp_path / "ref.docx"
+        template_path.write_bytes(MINIMAL_DOCX_BYTES)
+        input_path = tmp_path / "test.md"
+        input_path.write_text("# Server Test\n")
+        output_path = tmp_path / "output.docx"
+
+        converter = MarkdownToDocxConverter(reference_doc=template_path)
+        converter._server_url = url
+
+        result = converter.convert(input_path, output_path, toc=True, toc_depth=3)
+
+        assert result == output_path
+        assert output_path.read_bytes() == MINIMAL_DOCX_BYTES
+
+        # Field names follow pandoc-server's JSON API: pandoc's long
+        # option names, with extra files passed by name via "files"
+        payload = payloads[0]
+        assert payload["text"] == "# Server Test\n"
+        assert payload["from"] == converter.config.pandoc.reader_format
+        assert payload["to"] == converter.config.pandoc.writer_format
+        assert payload["table-of-contents"] is True
+        assert payload["toc-depth"] == 3
+        assert payload["reference-doc"] == "ref.docx"
+        assert base64.b64decode(payload["files"]["ref.docx"]) == MINIMAL_DOCX_BYTES
 
 
 # ============================================================================
@@ -316,56 +466,76 @@ class TestPandocValidation:
 # Pandoc Arguments Tests
 # ============================================================================
 
+def _kv(args):
+    """Map each --flag to the token that follows it in a single pass.
+
+    Order-independent replacement for repeated args.index() scans; flags
+    without a value map to the next flag, which no assertion relies on.
+    """
+    return {tok: nxt for tok, nxt in zip(args, args[1:]) if tok.startswith("--")}
+
+
 class TestPandocArgsGeneration:
     """Test Pandoc arguments generation."""
 
-    def test_build_pandoc_args_basic(self):
-        """Test basic Pandoc arguments building."""
-        converter = MarkdownToDocxConverter()
-        args = converter._build_pandoc_args(toc=False, toc_depth=3, extra_args=None)
-        
+    @pytest.fixture(scope="class")
+    def converter(self):
+        """One converter for the whole class; args building never mutates it.
+
+        Class-scoped fixtures are built before the function-scoped autouse
+        version stub, so stub the probe here for the construction.
+        """
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(
+                "markdown2docx.converter.pypandoc.get_pandoc_version",
+                lambda: "2.19.2",
+            )
+            yield MarkdownToDocxConverter()
+
+    @pytest.mark.parametrize(
+        ("kwargs", "expected_args"),
+        [
+            ({"toc": False, "toc_depth": 3, "extra_args": None}, []),
+            ({"toc": True, "toc_depth": 3, "extra_args": None}, ["--toc"]),
+            (
+                {"toc": True, "toc_depth": 4, "extra_args": None},
+                ["--toc", "--toc-depth", "4"],
+            ),
+            (
+                {
+                    "toc": False,
+                    "toc_depth": 3,
+                    "extra_args": ["--highlight-style=tango", "--number-sections"],
+                },
+                ["--highlight-style=tango", "--number-sections"],
+            ),
+        ],
+    )
+    def test_build_pandoc_args(self, converter, kwargs, expected_args):
+        """Test Pandoc arguments building across option combinations."""
+        args = converter._build_pandoc_args(**kwargs)
+
         assert isinstance(args, list)
         assert all(isinstance(arg, str) for arg in args)
+        for expected in expected_args:
+            assert expected in args
 
-    def test_build_pandoc_args_with_toc(self):
-        """Test Pandoc arguments with table of contents."""
-        converter = MarkdownToDocxConverter()
-        args = converter._build_pandoc_args(toc=True, toc_depth=3, extra_args=None)
-        
-        assert "--toc" in args
-
-    def test_build_pandoc_args_with_toc_depth(self):
-        """Test Pandoc arguments with TOC depth."""
-        converter = MarkdownToDocxConverter()
+    def test_build_pandoc_args_toc_depth_value(self, converter):
+        """Test that TOC depth is passed as a separate value argument."""
         args = converter._build_pandoc_args(toc=True, toc_depth=4, extra_args=None)
-        
-        assert "--toc" in args
-        # TOC depth is passed as separate arguments
-        toc_depth_idx = args.index("--toc-depth")
-        assert args[toc_depth_idx + 1] == "4"
 
-    def test_build_pandoc_args_with_reference_doc(self):
+        assert _kv(args)["--toc-depth"] == "4"
+
+    def test_build_pandoc_args_with_reference_doc(self, tmp_path):
         """Test Pandoc arguments with reference document."""
-        with tempfile.NamedTemporaryFile(suffix=".docx", delete=False) as tmp:
-            ref_path = Path(tmp.name)
-            try:
-                converter = MarkdownToDocxConverter(reference_doc=ref_path)
-                args = converter._build_pandoc_args(toc=False, toc_depth=3, extra_args=None)
-                
-                # Reference doc is passed as separate arguments
-                ref_doc_idx = args.index("--reference-doc")
-                assert args[ref_doc_idx + 1] == str(ref_path)
-            finally:
-                ref_path.unlink()
+        ref_path = tmp_path / "reference.docx"
+        ref_path.touch()
 
-    def test_build_pandoc_args_with_extra_args(self):
-        """Test Pandoc arguments with extra arguments."""
-        converter = MarkdownToDocxConverter()
-        extra_args = ["--highlight-style=tango", "--number-sections"]
-        args = converter._build_pandoc_args(toc=False, toc_depth=3, extra_args=extra_args)
-        
-        for extra_arg in extra_args:
-            assert extra_arg in args
+        converter = MarkdownToDocxConverter(reference_doc=ref_path)
+        args = converter._build_pandoc_args(toc=False, toc_depth=3, extra_args=None)
+
+        # Reference doc is passed as separate arguments
+        assert _kv(args)["--reference-doc"] == str(ref_path)
 
 
 # ============================================================================
@@ -375,29 +545,44 @@ class TestPandocArgsGeneration:
 class TestDocxValidation:
     """Test DOCX file validation."""
 
-    def test_validate_docx_success(self):
+    def test_validate_docx_success(self, tmp_path):
         """Test successful DOCX validation."""
-        # Create a minimal valid DOCX file using python-docx
-        try:
-            from docx import Document
-        except ImportError:
-            pytest.skip("python-docx not available for creating test DOCX file")
-        
-        with tempfile.NamedTemporaryFile(suffix=".docx", delete=False) as tmp:
-            output_path = Path(tmp.name)
-            
-            try:
-                # Create a minimal valid DOCX document
-                doc = Document()
-                doc.add_paragraph("Test content")
-                doc.save(str(output_path))
-                
-                converter = MarkdownToDocxConverter()
-                # Should not raise any exception
-                converter._validate_docx_output(output_path)
-                
-            finally:
-                output_path.unlink()
+        output_path = tmp_path / "valid.docx"
+        output_path.write_bytes(MINIMAL_DOCX_BYTES)
+
+        converter = MarkdownToDocxConverter()
+        # Should not raise any exception
+        converter._validate_docx_output(output_path)
+
+    def test_validate_docx_fast_success(self, tmp_path):
+        """Test fast validation accepts a file with the zip magic bytes."""
+        output_path = tmp_path / "valid.docx"
+        output_path.write_bytes(MINIMAL_DOCX_BYTES)
+
+        converter = MarkdownToDocxConverter()
+        # Should not raise any exception
+        converter._validate_docx_fast(output_path)
+
+    def test_validate_docx_fast_rejects_non_zip(self, tmp_path):
+        """Test fast validation rejects a file without the zip magic bytes."""
+        output_path = tmp_path / "bad.docx"
+        output_path.write_text("this is not a zip archive")
+
+        converter = MarkdownToDocxConverter()
+        with pytest.raises(ValidationError) as exc_info:
+            converter._validate_docx_fast(output_path)
+
+        assert "not a valid ZIP/DOCX archive" in str(exc_info.value)
+
+    def test_convert_with_fast_validation(self, tmp_path):
+        """Test that convert accepts validate_output='fast'."""
+        input_path = tmp_path / "test.md"
+        input_path.write_text("# Fast validation\n\nBody.\n")
+
+        converter = MarkdownToDocxConverter()
+        output_path = converter.convert(input_path, validate_output="fast")
+
+        assert output_path.exists()
 
     def test_validate_docx_missing_file(self):
         """Test DOCX validation with missing file."""
@@ -409,17 +594,16 @@ class TestDocxValidation:
         
         assert "Output file was not created" in str(exc_info.value)
 
-    def test_validate_docx_empty_file(self):
+    def test_validate_docx_empty_file(self, tmp_path):
         """Test DOCX validation with empty file."""
-        with tempfile.NamedTemporaryFile(suffix=".docx") as tmp:
-            output_path = Path(tmp.name)
-            # File is empty by default
-            
-            converter = MarkdownToDocxConverter()
-            with pytest.raises(ValidationError) as exc_info:
-                converter._validate_docx_output(output_path)
-            
-            assert "Output file is empty" in str(exc_info.value)
+        output_path = tmp_path / "empty.docx"
+        output_path.touch()
+
+        converter = MarkdownToDocxConverter()
+        with pytest.raises(ValidationError) as exc_info:
+            converter._validate_docx_output(output_path)
+
+        assert "Output file is empty" in str(exc_info.value)
 
 
 # ============================================================================
@@ -430,24 +614,19 @@ class TestConversionErrors:
     """Test conversion error handling."""
 
     @patch("markdown2docx.converter.pypandoc.convert_file")
-    def test_convert_pypandoc_error(self, mock_convert):
+    def test_convert_pypandoc_error(self, mock_convert, tmp_path):
         """Test handling of pypandoc conversion errors."""
         mock_convert.side_effect = RuntimeError("Pandoc conversion failed")
-        
-        with tempfile.NamedTemporaryFile(suffix=".md", mode="w", delete=False) as tmp:
-            tmp.write("# Test\nContent")
-            tmp.flush()
-            input_path = Path(tmp.name)
-            
-            try:
-                converter = MarkdownToDocxConverter()
-                with pytest.raises(ConversionError) as exc_info:
-                    converter.convert(input_path)
-                
-                assert "Pandoc conversion failed" in str(exc_info.value)
-                assert str(input_path) in str(exc_info.value)
-            finally:
-                input_path.unlink()
+
+        input_path = tmp_path / "test.md"
+        input_path.write_text("# Test\nContent")
+
+        converter = MarkdownToDocxConverter()
+        with pytest.raises(ConversionError) as exc_info:
+            converter.convert(input_path)
+
+        assert "Pandoc conversion failed" in str(exc_info.value)
+        assert str(input_path) in str(exc_info.value)
 
     def test_convert_nonexistent_input(self):
         """Test conversion with nonexistent input file."""
@@ -458,22 +637,17 @@ class TestConversionErrors:
             converter.convert(nonexistent_path)
 
     @patch("markdown2docx.converter.pypandoc.convert_file")
-    def test_convert_with_validation_failure(self, mock_convert):
+    def test_convert_with_validation_failure(self, mock_convert, tmp_path):
         """Test conversion with validation failure."""
         # Mock successful conversion but create empty output file
         mock_convert.return_value = None
-        
-        with tempfile.NamedTemporaryFile(suffix=".md", mode="w", delete=False) as tmp:
-            tmp.write("# Test\nContent")
-            tmp.flush()
-            input_path = Path(tmp.name)
-            
-            try:
-                converter = MarkdownToDocxConverter()
-                with pytest.raises(ValidationError):
-                    converter.convert(input_path, validate_output=True)
-            finally:
-                input_path.unlink()
+
+        input_path = tmp_path / "test.md"
+        input_path.write_text("# Test\nContent")
+
+        converter = MarkdownToDocxConverter()
+        with pytest.raises(ValidationError):
+            converter.convert(input_path, validate_output=True)
 
 
 # ============================================================================
@@ -483,57 +657,189 @@ class TestConversionErrors:
 class TestConvertWithTemplate:
     """Test template-based conversion."""
 
-    def test_convert_with_template_success(self):
+    def test_convert_with_template_success(self, tmp_path):
         """Test successful template-based conversion."""
-        with tempfile.NamedTemporaryFile(suffix=".md", mode="w", delete=False) as md_tmp:
-            md_tmp.write("# Test Document\nThis is a test.")
-            md_tmp.flush()
-            input_path = Path(md_tmp.name)
-            
-            with tempfile.NamedTemporaryFile(suffix=".docx", delete=False) as docx_tmp:
-                template_path = Path(docx_tmp.name)
-                
-                try:
-                    converter = MarkdownToDocxConverter()
-                    with patch("markdown2docx.converter.pypandoc.convert_file") as mock_convert:
-                        mock_convert.return_value = None
-                        
-                        # Create the expected output file since mock won't do it
-                        expected_output = input_path.with_suffix(".docx")
-                        expected_output.write_text("mock docx content")
-                        
-                        result = converter.convert_with_template(
-                            input_path, 
-                            template_path,
-                            validate_output=False
-                        )
-                        
-                        assert result.exists()
-                        mock_convert.assert_called_once()
-                        
-                        # Clean up
-                        expected_output.unlink()
-                finally:
-                    input_path.unlink()
-                    template_path.unlink()
-                    if result and result.exists():
-                        result.unlink()
+        input_path = tmp_path / "test.md"
+        input_path.write_text("# Test Document\nThis is a test.")
+        template_path = tmp_path / "template.docx"
+        template_path.touch()
+
+        converter = MarkdownToDocxConverter()
+        with patch("markdown2docx.converter.pypandoc.convert_file") as mock_convert:
+            mock_convert.return_value = None
 
-    def test_convert_with_template_nonexistent_template(self):
+            # Create the expected output file since mock won't do it
+            expected_output = input_path.with_suffix(".docx")
+            expected_output.write_text("mock docx content")
+
+            result = converter.convert_with_template(
+                input_path,
+                template_path,
+                validate_output=False
+            )
+
+            assert result.exists()
+            mock_convert.assert_called_once()
+
+    def test_convert_with_template_nonexistent_template(self, tmp_path):
         """Test template conversion with nonexistent template."""
-        with tempfile.NamedTemporaryFile(suffix=".md", mode="w", delete=False) as tmp:
-            tmp.write("# Test\nContent")
-            tmp.flush()
-            input_path = Path(tmp.name)
-            
-            nonexistent_template = Path("/nonexistent/template.docx")
-            
-            try:
-                converter = MarkdownToDocxConverter()
-                with pytest.raises(FileNotFoundError):
-                    converter.convert_with_template(input_path, nonexistent_template)
-            finally:
-                input_path.unlink()
+        input_path = tmp_path / "test.md"
+        input_path.write_text("# Test\nContent")
+
+        nonexistent_template = Path("/nonexistent/template.docx")
+
+        converter = MarkdownToDocxConverter()
+        with pytest.raises(FileNotFoundError):
+            converter.convert_with_template(input_path, nonexistent_template)
+
+
+class TestConvertMany:
+    """Test batch conversion via convert_many."""
+
+    def test_convert_many_converts_each_pair(self):
+        """Test that convert_many converts every pair in order."""
+        with patch("markdown2docx.converter.pypandoc.get_pandoc_version") as mock_version:
+            mock_version.return_value = "3.1.9"
+            converter = MarkdownToDocxConverter()
+
+        pairs = [("a.md", None), ("b.md", "out/b.docx")]
+
+        with patch.object(converter, "convert") as mock_convert:
+            mock_convert.side_effect = lambda input_path, output_path, **kwargs: (
+                Path(output_path) if output_path else Path(input_path).with_suffix(".docx")
+            )
+
+            results = converter.convert_many(pairs, toc=True)
+
+            assert results == [Path("a.docx"), Path("out/b.docx")]
+            assert mock_convert.call_count == 2
+            mock_convert.assert_any_call("a.md", None, toc=True)
+            mock_convert.assert_any_call("b.md", "out/b.docx", toc=True)
+
+    def test_convert_many_serial_with_single_worker(self):
+        """Test that max_workers=1 runs conversions serially in order."""
+        with patch("markdown2docx.converter.pypandoc.get_pandoc_version") as mock_version:
+            mock_version.return_value = "3.1.9"
+            converter = MarkdownToDocxConverter()
+
+        converted = []
+
+        with patch.object(converter, "convert") as mock_convert:
+            mock_convert.side_effect = lambda input_path, output_path, **kwargs: (
+                converted.append(input_path) or Path(input_path).with_suffix(".docx")
+            )
+
+            converter.convert_many([("a.md", None), ("b.md", None)], max_workers=1)
+
+            assert converted == ["a.md", "b.md"]
+
+    def test_convert_many_empty_batch(self):
+        """Test that convert_many handles an empty batch."""
+        with patch("markdown2docx.converter.pypandoc.get_pandoc_version") as mock_version:
+            mock_version.return_value = "3.1.9"
+            converter = MarkdownToDocxConverter()
+
+        assert converter.convert_many([]) == []
+
+
+class TestConvertToBytes:
+    """Test in-memory conversion via convert_to_bytes."""
+
+    def test_convert_to_bytes_returns_docx_content(self, tmp_path):
+        """Test that convert_to_bytes returns the DOCX bytes without leftovers."""
+        input_path = tmp_path / "doc.md"
+        input_path.write_text("# Title\n\nBody content.")
+
+        with patch("markdown2docx.converter.pypandoc.get_pandoc_version") as mock_version:
+            mock_version.return_value = "3.1.9"
+            converter = MarkdownToDocxConverter()
+
+            with patch("markdown2docx.converter.pypandoc.convert_file") as mock_convert:
+                mock_convert.side_effect = lambda source, **kwargs: Path(
+                    kwargs["outputfile"]
+                ).write_bytes(b"mock docx bytes")
+
+                result = converter.convert_to_bytes(input_path)
+
+        assert result == b"mock docx bytes"
+        # The temporary output should be cleaned up
+        outputfile = Path(mock_convert.call_args.kwargs["outputfile"])
+        assert not outputfile.exists()
+
+    def test_convert_to_bytes_without_overwrite(self, tmp_path):
+        """Test convert_to_bytes when overwrite_existing is disabled.
+
+        mkstemp pre-creates the temporary output; the overwrite guard
+        must not mistake that placeholder for a real existing file.
+        """
+        config = MarkdownToDocxConfig.from_dict(
+            {"conversion": {"overwrite_existing": False}}
+        )
+        input_path = tmp_path / "doc.md"
+        input_path.write_text("# Title\n\nBody content.")
+
+        with patch("markdown2docx.converter.pypandoc.get_pandoc_version") as mock_version:
+            mock_version.return_value = "3.1.9"
+            converter = MarkdownToDocxConverter(config=config)
+
+            with patch("markdown2docx.converter.pypandoc.convert_file") as mock_convert:
+                mock_convert.side_effect = lambda source, **kwargs: Path(
+                    kwargs["outputfile"]
+                ).write_bytes(b"mock docx bytes")
+
+                result = converter.convert_to_bytes(input_path)
+
+        assert result == b"mock docx bytes"
+
+
+class TestConversionCache:
+    """Test the content-hash conversion cache."""
+
+    def test_cache_hit_skips_pandoc(self, tmp_path):
+        """Test that re-converting identical content reuses the cached DOCX."""
+        config = MarkdownToDocxConfig.from_dict(
+            {"conversion": {"cache_dir": str(tmp_path / "cache")}}
+        )
+        input_path = tmp_path / "doc.md"
+        input_path.write_text("# Title\n\nBody content.")
+
+        with patch("markdown2docx.converter.pypandoc.get_pandoc_version") as mock_version:
+            mock_version.return_value = "3.1.9"
+            converter = MarkdownToDocxConverter(config=config)
+
+            with patch("markdown2docx.converter.pypandoc.convert_file") as mock_convert:
+                mock_convert.side_effect = lambda source, **kwargs: Path(
+                    kwargs["outputfile"]
+                ).write_text("mock docx content")
+
+                first = converter.convert(input_path, tmp_path / "a.docx")
+                second = converter.convert(input_path, tmp_path / "b.docx")
+
+                assert mock_convert.call_count == 1
+                assert first.read_text() == second.read_text()
+
+    def test_changed_content_misses_cache(self, tmp_path):
+        """Test that changing the input content bypasses the cache."""
+        config = MarkdownToDocxConfig.from_dict(
+            {"conversion": {"cache_dir": str(tmp_path / "cache")}}
+        )
+        input_path = tmp_path / "doc.md"
+        input_path.write_text("# First version")
+
+        with patch("markdown2docx.converter.pypandoc.get_pandoc_version") as mock_version:
+            mock_version.return_value = "3.1.9"
+            converter = MarkdownToDocxConverter(config=config)
+
+            with patch("markdown2docx.converter.pypandoc.convert_file") as mock_convert:
+                mock_convert.side_effect = lambda source, **kwargs: Path(
+                    kwargs["outputfile"]
+                ).write_text("mock docx content")
+
+                converter.convert(input_path, tmp_path / "a.docx")
+                input_path.write_text("# Second version")
+                converter.convert(input_path, tmp_path / "b.docx")
+
+                assert mock_convert.call_count == 2
 
 
 # ============================================================================
@@ -12,178 +12,177 @@ from markdown2docx.exceptions import (
     ValidationError,
 )
 
+_PANDOC_NOT_FOUND_MESSAGE = (
+    "Pandoc not found. Please install Pandoc or call pypandoc.download_pandoc()."
+)
 
-class TestMarkdownToDocxError:
-    """Test the base MarkdownToDocxError class."""
-
-    def test_basic_error(self):
-        """Test basic error creation and string representation."""
-        error = MarkdownToDocxError("Test error message")
-        assert str(error) == "Test error message"
-        assert error.message == "Test error message"
-        assert error.details is None
-
-    def test_error_with_details(self):
-        """Test error with additional details."""
-        error = MarkdownToDocxError("Test error", "Additional details")
-        expected = "Test error\nDetails: Additional details"
-        assert str(error) == expected
-        assert error.message == "Test error"
-        assert error.details == "Additional details"
-
-
-class TestPandocError:
-    """Test PandocError and related exceptions."""
-
-    def test_basic_pandoc_error(self):
-        """Test basic PandocError creation."""
-        error = PandocError("Pandoc failed")
-        assert str(error) == "Pandoc failed"
-        assert error.pandoc_version is None
-        assert error.command is None
-
-    def test_pandoc_error_with_version(self):
-        """Test PandocError with version information."""
-        error = PandocError("Pandoc failed", pandoc_version="2.19.2")
-        expected = "Pandoc failed\nDetails: Pandoc version: 2.19.2"
-        assert str(error) == expected
-        assert error.pandoc_version == "2.19.2"
-
-    def test_pandoc_error_with_command(self):
-        """Test PandocError with command information."""
-        error = PandocError("Pandoc failed", command="pandoc -f markdown -t docx")
-        expected = "Pandoc failed\nDetails: Failed command: pandoc -f markdown -t docx"
-        assert str(error) == expected
-        assert error.command == "pandoc -f markdown -t docx"
-
-    def test_pandoc_error_with_version_and_command(self):
-        """Test PandocError with both version and command."""
-        error = PandocError(
+# Shared original exception for the ConversionError wrapping case, so the
+# identity assertion can compare against the same object
+_ORIGINAL_ERROR = ValueError("Invalid input")
+
+
+@pytest.mark.parametrize(
+    ("make_exc", "expected_str", "expected_attrs"),
+    [
+        pytest.param(
+            lambda: MarkdownToDocxError("Test error message"),
+            "Test error message",
+            {"message": "Test error message", "details": None},
+            id="base",
+        ),
+        pytest.param(
+            lambda: MarkdownToDocxError("Test error", "Additional details"),
+            "Test error\nDetails: Additional details",
+            {"message": "Test error", "details": "Additional details"},
+            id="base-with-details",
+        ),
+        pytest.param(
+            lambda: PandocError("Pandoc failed"),
             "Pandoc failed",
-            pandoc_version="2.19.2",
-            command="pandoc -f markdown -t docx"
-        )
-        expected = (
+            {"pandoc_version": None, "command": None},
+            id="pandoc",
+        ),
+        pytest.param(
+            lambda: PandocError("Pandoc failed", pandoc_version="2.19.2"),
+            "Pandoc failed\nDetails: Pandoc version: 2.19.2",
+            {"pandoc_version": "2.19.2"},
+            id="pandoc-with-version",
+        ),
+        pytest.param(
+            lambda: PandocError("Pandoc failed", command="pandoc -f markdown -t docx"),
+            "Pandoc failed\nDetails: Failed command: pandoc -f markdown -t docx",
+            {"command": "pandoc -f markdown -t docx"},
+            id="pandoc-with-command",
+        ),
+        pytest.param(
+            lambda: PandocError(
+                "Pandoc failed",
+                pandoc_version="2.19.2",
+                command="pandoc -f markdown -t docx",
+            ),
             "Pandoc failed\n"
-            "Details: Pandoc version: 2.19.2; Failed command: pandoc -f markdown -t docx"
-        )
-        assert str(error) == expected
-        assert error.pandoc_version == "2.19.2"
-        assert error.command == "pandoc -f markdown -t docx"
-
-    def test_pandoc_not_found_error(self):
-        """Test PandocNotFoundError."""
-        error = PandocNotFoundError()
-        expected_message = "Pandoc not found. Please install Pandoc or call pypandoc.download_pandoc()."
-        assert error.message == expected_message
-        assert "installation instructions" in error.details
-        assert str(error).startswith(expected_message)
-
-
-class TestConversionError:
-    """Test ConversionError class."""
-
-    def test_basic_conversion_error(self):
-        """Test basic ConversionError creation."""
-        error = ConversionError("test.md", "Conversion failed")
-        assert error.message == "Conversion failed"
-        assert error.input_file == "test.md"
-        assert error.original_error is None
-        assert "Input file: test.md" in str(error)
-
-    def test_conversion_error_with_original_error(self):
-        """Test ConversionError with original exception."""
-        original = ValueError("Invalid input")
-        error = ConversionError("test.md", "Conversion failed", original)
-        
-        assert error.message == "Conversion failed"
-        assert error.input_file == "test.md"
-        assert error.original_error is original
-        
-        error_str = str(error)
-        assert "Input file: test.md" in error_str
-        assert "Original error: ValueError: Invalid input" in error_str
-
-
-class TestTemplateError:
-    """Test TemplateError class."""
-
-    def test_template_error_with_path(self):
-        """Test TemplateError with template path."""
-        error = TemplateError("template.docx", "Template is invalid")
-        assert error.message == "Template is invalid"
-        assert error.template_path == "template.docx"
-        assert "Template path: template.docx" in str(error)
-
-    def test_template_error_without_path(self):
-        """Test TemplateError without template path."""
-        error = TemplateError(None, "Template is invalid")
-        assert error.message == "Template is invalid"
-        assert error.template_path is None
-        assert str(error) == "Template is invalid"
-
-
-class TestValidationError:
-    """Test ValidationError class."""
-
-    def test_validation_error(self):
-        """Test ValidationError creation."""
-        validation_errors = ["Missing required style", "Invalid structure"]
-        error = ValidationError("output.docx", validation_errors)
-        
-        assert error.message == "DOCX validation failed for output.docx"
-        assert error.output_file == "output.docx"
-        assert error.validation_errors == validation_errors
-        
-        error_str = str(error)
-        assert "DOCX validation failed for output.docx" in error_str
-        assert "Missing required style" in error_str
-        assert "Invalid structure" in error_str
-
-    def test_validation_error_single_error(self):
-        """Test ValidationError with single validation error."""
-        error = ValidationError("output.docx", ["Single error"])
-        assert "Single error" in str(error)
-
-
-class TestConfigurationError:
-    """Test ConfigurationError class."""
-
-    def test_configuration_error_with_key(self):
-        """Test ConfigurationError with configuration key."""
-        error = ConfigurationError("pandoc.path", "Invalid path specified")
-        assert error.message == "Invalid path specified"
-        assert error.config_key == "pandoc.path"
-        assert "Configuration key: pandoc.path" in str(error)
-
-    def test_configuration_error_without_key(self):
-        """Test ConfigurationError without configuration key."""
-        error = ConfigurationError(None, "Invalid configuration")
-        assert error.message == "Invalid configuration"
-        assert error.config_key is None
-        assert str(error) == "Invalid configuration"
-
-
-class TestExceptionInheritance:
-    """Test exception inheritance hierarchy."""
-
-    def test_all_exceptions_inherit_from_base(self):
-        """Test that all custom exceptions inherit from MarkdownToDocxError."""
-        exceptions = [
-            PandocError("test"),
-            PandocNotFoundError(),
-            ConversionError("test.md", "test"),
-            TemplateError("test.docx", "test"),
-            ValidationError("test.docx", ["test"]),
-            ConfigurationError("test", "test"),
-        ]
-        
-        for exc in exceptions:
-            assert isinstance(exc, MarkdownToDocxError)
-            assert isinstance(exc, Exception)
-
-    def test_pandoc_not_found_inherits_from_pandoc_error(self):
-        """Test that PandocNotFoundError inherits from PandocError."""
-        error = PandocNotFoundError()
-        assert isinstance(error, PandocError)
-        assert isinstance(error, MarkdownToDocxError)
\ No newline at end of file
+            "Details: Pandoc version: 2.19.2; "
+            "Failed command: pandoc -f markdown -t docx",
+            {"pandoc_version": "2.19.2", "command": "pandoc -f markdown -t docx"},
+            id="pandoc-with-version-and-command",
+        ),
+        pytest.param(
+            lambda: TemplateError(None, "Template is invalid"),
+            "Template is invalid",
+            {"message": "Template is invalid", "template_path": None},
+            id="template-without-path",
+        ),
+        pytest.param(
+            lambda: ConfigurationError(None, "Invalid configuration"),
+            "Invalid configuration",
+            {"message": "Invalid configuration", "config_key": None},
+            id="configuration-without-key",
+        ),
+    ],
+)
+def test_exception_str_and_attrs(make_exc, expected_str, expected_attrs):
+    """Test exact string representation and attributes per exception case."""
+    error = make_exc()
+    assert str(error) == expected_str
+    for attr, expected in expected_attrs.items():
+        assert getattr(error, attr) == expected
+
+
+@pytest.mark.parametrize(
+    ("make_exc", "expected_substrings", "expected_attrs"),
+    [
+        pytest.param(
+            lambda: PandocNotFoundError(),
+            [_PANDOC_NOT_FOUND_MESSAGE, "installation instructions"],
+            {"message": _PANDOC_NOT_FOUND_MESSAGE},
+            id="pandoc-not-found",
+        ),
+        pytest.param(
+            lambda: ConversionError("test.md", "Conversion failed"),
+            ["Input file: test.md"],
+            {
+                "message": "Conversion failed",
+                "input_file": "test.md",
+                "original_error": None,
+            },
+            id="conversion",
+        ),
+        pytest.param(
+            lambda: ConversionError("test.md", "Conversion failed", _ORIGINAL_ERROR),
+            ["Input file: test.md", "Original error: ValueError: Invalid input"],
+            {
+                "message": "Conversion failed",
+                "input_file": "test.md",
+                "original_error": _ORIGINAL_ERROR,
+            },
+            id="conversion-with-original",
+        ),
+        pytest.param(
+            lambda: TemplateError("template.docx", "Template is invalid"),
+            ["Template path: template.docx"],
+            {"message": "Template is invalid", "template_path": "template.docx"},
+            id="template-with-path",
+        ),
+        pytest.param(
+            lambda: ValidationError(
+                "output.docx", ["Missing required style", "Invalid structure"]
+            ),
+            [
+                "DOCX validation failed for output.docx",
+                "Missing required style",
+                "Invalid structure",
+            ],
+            {
+                "message": "DOCX validation failed for output.docx",
+                "output_file": "output.docx",
+                "validation_errors": ["Missing required style", "Invalid structure"],
+            },
+            id="validation",
+        ),
+        pytest.param(
+            lambda: ValidationError("output.docx", ["Single error"]),
+            ["Single error"],
+            {},
+            id="validation-single-error",
+        ),
+        pytest.param(
+            lambda: ConfigurationError("pandoc.path", "Invalid path specified"),
+            ["Configuration key: pandoc.path"],
+            {"message": "Invalid path specified", "config_key": "pandoc.path"},
+            id="configuration-with-key",
+        ),
+    ],
+)
+def test_exception_details(make_exc, expected_substrings, expected_attrs):
+    """Test detail substrings and attributes per exception case."""
+    error = make_exc()
+    error_str = str(error)
+    for substring in expected_substrings:
+        assert substring in error_str
+    for attr, expected in expected_attrs.items():
+        assert getattr(error, attr) == expected
+
+
+@pytest.mark.parametrize(
+    "make_exc",
+    [
+        pytest.param(lambda: PandocError("test"), id="pandoc"),
+        pytest.param(lambda: PandocNotFoundError(), id="pandoc-not-found"),
+        pytest.param(lambda: ConversionError("test.md", "test"), id="conversion"),
+        pytest.param(lambda: TemplateError("test.docx", "test"), id="template"),
+        pytest.param(lambda: ValidationError("test.docx", ["test"]), id="validation"),
+        pytest.param(lambda: ConfigurationError("test", "test"), id="configuration"),
+    ],
+)
+def test_exceptions_inherit_from_base(make_exc):
+    """Test that all custom exceptions inherit from MarkdownToDocxError."""
+    error = make_exc()
+    assert isinstance(error, MarkdownToDocxError)
+    assert isinstance(error, Exception)
+
+
+def test_pandoc_not_found_inherits_from_pandoc_error():
+    """Test that PandocNotFoundError inherits from PandocError."""
+    error = PandocNotFoundError()
+    assert isinstance(error, PandocError)
+    assert isinstance(error, MarkdownToDocxError)
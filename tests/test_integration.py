@@ -3,19 +3,21 @@
 端到端集成测试，确保整个转换流程正常工作。
 """
 
-import sys
+import zipfile
 from pathlib import Path
-from tempfile import TemporaryDirectory
 
 import pytest
 from docx import Document
 
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from conftest import HEADING_STYLES
 
 from markdown2docx import DocxTemplateManager, MarkdownToDocxConverter
 
+# These tests assert on real converted content, so keep the real pandoc run
+pytestmark = pytest.mark.no_mock_pandoc
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def complex_markdown():
     """Complex markdown content for integration testing."""
     return """# Integration Test Document
@@ -101,112 +103,112 @@ This integration test covers all major Markdown features to ensure comprehensive
 """
 
 
-def test_full_conversion_pipeline(complex_markdown):
-    """Test complete conversion pipeline from markdown to DOCX."""
-    with TemporaryDirectory() as tmpdir:
-        tmpdir_path = Path(tmpdir)
-        input_path = tmpdir_path / "integration_test.md"
-        output_path = tmpdir_path / "integration_output.docx"
+@pytest.fixture(scope="session")
+def converted_complex_docx(tmp_path_factory, complex_markdown):
+    """One default-args conversion of the complex sample, shared read-only.
 
-        input_path.write_text(complex_markdown)
+    Pandoc startup dominates these tests; tests that convert with the
+    same arguments inspect this artifact instead of re-running pandoc.
+    Conversions with different arguments (TOC, reference doc) still run
+    their own.
+    """
+    base = tmp_path_factory.mktemp("integration")
+    return MarkdownToDocxConverter().convert_text(
+        complex_markdown, base / "integration_output.docx"
+    )
 
-        converter = MarkdownToDocxConverter()
-        result = converter.convert(input_path, output_path)
 
-        assert result == output_path
-        assert output_path.exists()
+def test_full_conversion_pipeline(converted_complex_docx):
+    """Test complete conversion pipeline from markdown to DOCX."""
+    assert converted_complex_docx.exists()
 
-        # Verify document structure
-        doc = Document(output_path)
+    # Verify document structure; doc.paragraphs rebuilds its list on every
+    # access, so materialize it once for all assertions
+    doc = Document(converted_complex_docx)
+    paragraphs = list(doc.paragraphs)
 
-        # Check that we have content
-        assert len(doc.paragraphs) > 10
+    # Check that we have content
+    assert len(paragraphs) > 10
 
-        # Check for headings
-        headings = [
-            p for p in doc.paragraphs if p.style and "heading" in p.style.name.lower()
-        ]
-        assert len(headings) >= 5  # Should have multiple heading levels
+    # Check for headings
+    headings = [
+        p for p in paragraphs if p.style and p.style.name in HEADING_STYLES
+    ]
+    assert len(headings) >= 5  # Should have multiple heading levels
 
-        # Check for tables
-        assert len(doc.tables) >= 1
+    # Check for tables
+    assert len(doc.tables) >= 1
 
 
-def test_template_based_conversion(complex_markdown):
+def test_template_based_conversion(complex_markdown, tmp_path):
     """Test conversion using custom template."""
-    with TemporaryDirectory() as tmpdir:
-        tmpdir_path = Path(tmpdir)
-        template_path = tmpdir_path / "custom_template.docx"
-        input_path = tmpdir_path / "test.md"
-        output_path = tmpdir_path / "output.docx"
+    template_path = tmp_path / "custom_template.docx"
+    input_path = tmp_path / "test.md"
+    output_path = tmp_path / "output.docx"
 
-        # Create template
-        DocxTemplateManager.create_modern_template(template_path)
+    # Create template
+    DocxTemplateManager.create_modern_template(template_path)
 
-        # Create input file
-        input_path.write_text(complex_markdown)
+    # Create input file
+    input_path.write_text(complex_markdown)
 
-        # Convert with template
-        converter = MarkdownToDocxConverter(reference_doc=template_path)
-        result = converter.convert(input_path, output_path)
+    # Convert with template
+    converter = MarkdownToDocxConverter(reference_doc=template_path)
+    result = converter.convert(input_path, output_path)
 
-        assert result == output_path
-        assert output_path.exists()
+    assert result == output_path
+    assert output_path.exists()
 
-        # Verify template was used
-        doc = Document(output_path)
+    # Verify template was used
+    doc = Document(output_path)
 
-        # Check margins (should match template)
-        section = doc.sections[0]
-        assert section.top_margin.emu == 914400  # 1 inch
+    # Check margins (should match template)
+    section = doc.sections[0]
+    assert section.top_margin.emu == 914400  # 1 inch
 
 
-def test_toc_generation(complex_markdown):
+def test_toc_generation(complex_markdown, tmp_path):
     """Test table of contents generation."""
-    with TemporaryDirectory() as tmpdir:
-        tmpdir_path = Path(tmpdir)
-        input_path = tmpdir_path / "test.md"
-        output_path = tmpdir_path / "output.docx"
+    input_path = tmp_path / "test.md"
+    output_path = tmp_path / "output.docx"
 
-        input_path.write_text(complex_markdown)
+    input_path.write_text(complex_markdown)
 
-        converter = MarkdownToDocxConverter()
-        result = converter.convert(
-            input_path,
-            output_path,
-            toc=True,
-            toc_depth=2,
-        )
+    converter = MarkdownToDocxConverter()
+    result = converter.convert(
+        input_path,
+        output_path,
+        toc=True,
+        toc_depth=2,
+    )
 
-        assert result == output_path
-        assert output_path.exists()
+    assert result == output_path
+    assert output_path.exists()
 
 
-def test_missing_template_handling(complex_markdown, caplog):
+def test_missing_template_handling(complex_markdown, caplog, tmp_path):
     """Test that missing template files are handled gracefully with warnings."""
-    with TemporaryDirectory() as tmpdir:
-        tmpdir_path = Path(tmpdir)
-        input_path = tmpdir_path / "test.md"
-        nonexistent_template = tmpdir_path / "missing_template.docx"
+    input_path = tmp_path / "test.md"
+    nonexistent_template = tmp_path / "missing_template.docx"
 
-        input_path.write_text(complex_markdown)
+    input_path.write_text(complex_markdown)
 
-        # Use converter with non-existent template
-        converter = MarkdownToDocxConverter(reference_doc=nonexistent_template)
-        result = converter.convert(input_path)
+    # Use converter with non-existent template
+    converter = MarkdownToDocxConverter(reference_doc=nonexistent_template)
+    result = converter.convert(input_path)
 
-        # Conversion should complete successfully
-        assert result.exists()
+    # Conversion should complete successfully
+    assert result.exists()
 
-        # Warning should be logged
-        assert "Reference document not found" in caplog.text
+    # Warning should be logged
+    assert "Reference document not found" in caplog.text
 
 
-def test_multilingual_conversion():
-    """Test conversion of multilingual content."""
-    multilingual_content = """# Multilingual Test 多语言测试
+# Multilingual and special-character samples merged into one document so
+# all Unicode-preservation tests share a single pandoc run
+_UNICODE_MARKDOWN = """# Multilingual Test 多语言测试
 
-This document contains multiple languages.
+This document contains multiple languages and special characters.
 
 ## English Section
 
@@ -227,67 +229,97 @@ This paragraph contains both English and 中文 characters in the same line.
 | English | Hello World | ✅ |
 | 中文 | 你好世界 | ✅ |
 | Español | Hola Mundo | ✅ |
+
+## Currency Symbols
+¥ $ € £ ₽ ₹ ₩ ₪
+
+## Mathematical Symbols
+∑ ∏ ∫ ∂ ∇ ∞ ± × ÷ ≠ ≤ ≥
+
+## Arrow Symbols
+← → ↑ ↓ ↔ ↕ ⇐ ⇒ ⇔
+
+## Quotation Marks
+"English quotes" 'Single quotes' « French quotes » „German quotes"
+
+## Emoji and Unicode
+🚀 🎉 ✅ ❌ 📝 💡 🔧 ⚡
+
+## Special Punctuation
+§ ¶ † ‡ • ‰ ′ ″ ‴ ※
 """
 
-    with TemporaryDirectory() as tmpdir:
-        tmpdir_path = Path(tmpdir)
-        input_path = tmpdir_path / "multilingual.md"
-        output_path = tmpdir_path / "multilingual_output.docx"
 
-        input_path.write_text(multilingual_content)
+@pytest.fixture(scope="session")
+def unicode_docx(tmp_path_factory):
+    """One conversion of the combined Unicode sample, shared read-only.
+
+    The multilingual and special-character tests assert on different
+    substrings of the same kind of output; converting their merged
+    sample once costs a single pandoc run for all of them. The source
+    never needs to touch disk, so it goes to pandoc directly.
+    """
+    output_path = tmp_path_factory.mktemp("unicode") / "unicode_output.docx"
+    return MarkdownToDocxConverter().convert_text(_UNICODE_MARKDOWN, output_path)
+
 
-        converter = MarkdownToDocxConverter()
-        result = converter.convert(input_path, output_path)
+@pytest.fixture(scope="module")
+def unicode_document_xml(unicode_docx):
+    """document.xml of the shared Unicode conversion, read once.
 
-        assert result == output_path
-        assert output_path.exists()
+    Reading it straight out of the zip covers body and table text
+    without the full python-docx parse.
+    """
+    with zipfile.ZipFile(unicode_docx) as docx_zip:
+        return docx_zip.read("word/document.xml").decode("utf-8")
 
-        # Verify multilingual content is preserved
-        doc = Document(output_path)
-        full_text = "\n".join(p.text for p in doc.paragraphs)
-        for table in doc.tables:
-            for row in table.rows:
-                for cell in row.cells:
-                    full_text += "\n" + cell.text
 
-        assert "多语言测试" in full_text
-        assert "中文部分" in full_text
-        assert "你好世界" in full_text
-        assert "Hola Mundo" in full_text
+@pytest.mark.slow
+@pytest.mark.parametrize(
+    "expected", ["多语言测试", "中文部分", "你好世界", "Hola Mundo"]
+)
+def test_multilingual_conversion(unicode_document_xml, expected):
+    """Test that multilingual content is preserved through conversion."""
+    assert expected in unicode_document_xml
 
 
-def test_error_recovery():
+def test_error_recovery(tmp_path):
     """Test error handling and recovery."""
-    with TemporaryDirectory() as tmpdir:
-        tmpdir_path = Path(tmpdir)
+    # Test with nonexistent input file
+    converter = MarkdownToDocxConverter()
 
-        # Test with nonexistent input file
-        converter = MarkdownToDocxConverter()
+    with pytest.raises(FileNotFoundError):
+        converter.convert("nonexistent.md")
 
-        with pytest.raises(FileNotFoundError):
-            converter.convert("nonexistent.md")
+    # Test with invalid template
+    invalid_template = tmp_path / "invalid.docx"
+    converter_with_template = MarkdownToDocxConverter(
+        reference_doc=invalid_template
+    )
 
-        # Test with invalid template
-        invalid_template = tmpdir_path / "invalid.docx"
-        converter_with_template = MarkdownToDocxConverter(
-            reference_doc=invalid_template
-        )
+    # Should still work without template
+    input_path = tmp_path / "test.md"
+    input_path.write_text("# Test")
 
-        # Should still work without template
-        input_path = tmpdir_path / "test.md"
-        input_path.write_text("# Test")
+    result = converter_with_template.convert(input_path)
+    assert result.exists()
 
-        result = converter_with_template.convert(input_path)
-        assert result.exists()
 
+# Pandoc runtime scales roughly linearly with input size; 20 sections
+# already prove the many-paragraph structure, the slow variant keeps the
+# original 100-section volume
+_LARGE_SECTIONS = 20
+_LARGE_SECTIONS_FULL = 100
 
-def test_large_document_conversion():
-    """Test conversion of large documents."""
-    # Generate large markdown content
-    large_content = "# Large Document Test\n\n"
 
-    for i in range(100):
-        large_content += f"""## Section {i+1}
+def _build_large_content(sections):
+    """Generate the repetitive large-document markdown sample."""
+    # Collect parts and join once; += in a loop reallocates the growing
+    # string on every iteration
+    parts = ["# Large Document Test\n\n"]
+
+    for i in range(sections):
+        parts.append(f"""## Section {i+1}
 
 This is section {i+1} with some content. It contains **bold text**, *italic text*, and `inline code`.
 
@@ -304,67 +336,45 @@ def section_{i+1}_function():
     return "Section {i+1} code"
 ```
 
-"""
-
-    with TemporaryDirectory() as tmpdir:
-        tmpdir_path = Path(tmpdir)
-        input_path = tmpdir_path / "large_document.md"
-        output_path = tmpdir_path / "large_output.docx"
-
-        input_path.write_text(large_content)
-
-        converter = MarkdownToDocxConverter()
-        result = converter.convert(input_path, output_path)
+""")
 
-        assert result == output_path
-        assert output_path.exists()
+    return "".join(parts)
 
-        # Verify document has expected structure
-        doc = Document(output_path)
-        assert len(doc.paragraphs) > 500  # Should have many paragraphs
 
+def _convert_large_document(tmp_path, sections):
+    """Convert a generated large document and return the parsed output."""
+    input_path = tmp_path / "large_document.md"
+    output_path = tmp_path / "large_output.docx"
 
-def test_special_characters_conversion():
-    """Test conversion of documents with special characters."""
-    special_content = """# Special Characters Test
-
-## Currency Symbols
-¥ $ € £ ₽ ₹ ₩ ₪
-
-## Mathematical Symbols
-∑ ∏ ∫ ∂ ∇ ∞ ± × ÷ ≠ ≤ ≥
+    input_path.write_text(_build_large_content(sections))
 
-## Arrow Symbols
-← → ↑ ↓ ↔ ↕ ⇐ ⇒ ⇔
+    converter = MarkdownToDocxConverter()
+    result = converter.convert(input_path, output_path)
 
-## Quotation Marks
-"English quotes" 'Single quotes' « French quotes » „German quotes"
+    assert result == output_path
+    assert output_path.exists()
+    return Document(output_path)
 
-## Emoji and Unicode
-🚀 🎉 ✅ ❌ 📝 💡 🔧 ⚡
 
-## Special Punctuation
-§ ¶ † ‡ • ‰ ′ ″ ‴ ※
-"""
+@pytest.mark.slow
+def test_large_document_conversion(tmp_path):
+    """Test conversion of large documents."""
+    doc = _convert_large_document(tmp_path, _LARGE_SECTIONS)
 
-    with TemporaryDirectory() as tmpdir:
-        tmpdir_path = Path(tmpdir)
-        input_path = tmpdir_path / "special_chars.md"
-        output_path = tmpdir_path / "special_output.docx"
+    # Verify document has expected structure
+    assert len(doc.paragraphs) > 100  # Should have many paragraphs
 
-        input_path.write_text(special_content)
 
-        converter = MarkdownToDocxConverter()
-        result = converter.convert(input_path, output_path)
+@pytest.mark.slow
+def test_large_document_conversion_full(tmp_path):
+    """Test conversion at the original full document volume."""
+    doc = _convert_large_document(tmp_path, _LARGE_SECTIONS_FULL)
 
-        assert result == output_path
-        assert output_path.exists()
+    assert len(doc.paragraphs) > 500  # Should have many paragraphs
 
-        # Verify special characters are preserved
-        doc = Document(output_path)
-        full_text = "\n".join([p.text for p in doc.paragraphs])
 
-        assert "¥" in full_text
-        assert "∑" in full_text
-        assert "←" in full_text
-        assert "🚀" in full_text
+@pytest.mark.slow
+@pytest.mark.parametrize("expected", ["¥", "∑", "←", "🚀"])
+def test_special_characters_conversion(unicode_document_xml, expected):
+    """Test that special characters are preserved through conversion."""
+    assert expected in unicode_document_xml
@@ -3,14 +3,13 @@
 DOCX样式处理测试，确保Markdown标题正确映射到Word标题样式。
 """
 
-import sys
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
 import pytest
 from docx import Document
 
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from conftest import HEADING_STYLES
 
 from markdown2docx.converter import MarkdownToDocxConverter
 from markdown2docx.templates import DocxTemplateManager
@@ -45,6 +44,7 @@ Content under sixth level heading. 这是第六级标题下的内容。
 """
 
 
+@pytest.mark.no_mock_pandoc
 def test_heading_styles_mapping(heading_markdown):
     """Test that markdown headings map to correct Word heading styles.
 
@@ -66,7 +66,7 @@ def test_heading_styles_mapping(heading_markdown):
         heading_styles = []
 
         for paragraph in doc.paragraphs:
-            if paragraph.style and "heading" in paragraph.style.name.lower():
+            if paragraph.style and paragraph.style.name in HEADING_STYLES:
                 heading_styles.append((paragraph.text, paragraph.style.name))
 
         # Verify correct heading mappings (验证正确的标题映射)
@@ -88,21 +88,16 @@ def test_heading_styles_mapping(heading_markdown):
             assert actual_style == expected_style
 
 
-def test_template_has_all_heading_styles():
+def test_template_has_all_heading_styles(modern_template):
     """Test that created template contains all heading styles.
 
     测试创建的模板包含所有标题样式。
     """
-    with TemporaryDirectory() as tmpdir:
-        template_path = Path(tmpdir) / "template.docx"
-        DocxTemplateManager.create_modern_template(template_path)
-
-        doc = Document(template_path)
-        style_names = [style.name for style in doc.styles]
+    doc = Document(modern_template)
+    style_names = frozenset(style.name for style in doc.styles)
 
-        # Check that all heading styles exist (检查所有标题样式是否存在)
-        for i in range(1, 7):
-            assert f"Heading {i}" in style_names
+    # Check that all heading styles exist (检查所有标题样式是否存在)
+    assert {f"Heading {i}" for i in range(1, 7)} <= style_names
 
 
 def test_pandoc_styles_extension():
@@ -147,7 +142,7 @@ def diagnose_docx_styles(docx_path):
                 }
             )
 
-            if paragraph.style and "heading" in paragraph.style.name.lower():
+            if paragraph.style and paragraph.style.name in HEADING_STYLES:
                 styles_info["heading_count"] += 1
 
     return styles_info
@@ -3,7 +3,6 @@
 模板系统测试，确保DOCX模板创建和使用功能正常。
 """
 
-import sys
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
@@ -11,13 +10,24 @@ import pytest
 from docx import Document
 from docx.enum.style import WD_STYLE_TYPE
 
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from conftest import HEADING_STYLES
 
 from markdown2docx.converter import MarkdownToDocxConverter
 from markdown2docx.exceptions import TemplateError
 from markdown2docx.templates import DocxTemplateManager
 
 
+@pytest.fixture(scope="module")
+def modern_template_doc(modern_template_with_sample):
+    """Parsed session template, shared read-only by this module's tests.
+
+    Document() re-unzips and re-parses the OOXML on every call; one parse
+    per module covers all the property assertions. Tests that mutate a
+    document must not use this fixture.
+    """
+    return Document(modern_template_with_sample)
+
+
 def test_create_modern_template():
     """Test modern template creation with all required styles."""
     with TemporaryDirectory() as tmpdir:
@@ -30,68 +40,54 @@ def test_create_modern_template():
         assert result == template_path
         assert template_path.exists()
 
-        # Verify template structure
+        # Verify template structure; one pass over the styles collection
+        # instead of an O(N) scan per membership check
         doc = Document(template_path)
-        style_names = [style.name for style in doc.styles]
+        style_names = frozenset(style.name for style in doc.styles)
 
         # Check that all heading styles exist
-        for i in range(1, 7):
-            assert f"Heading {i}" in style_names
+        assert {f"Heading {i}" for i in range(1, 7)} <= style_names
 
         # Check basic styles
         assert "Normal" in style_names
 
 
-def test_template_heading_styles():
-    """Test that template has properly configured heading styles."""
-    with TemporaryDirectory() as tmpdir:
-        template_path = Path(tmpdir) / "template.docx"
-        DocxTemplateManager.create_modern_template(template_path, add_sample=True)
-
-        doc = Document(template_path)
-
-        # Test heading style properties
-        heading1 = doc.styles["Heading 1"]
-        assert heading1.font.name == "Calibri"
-        assert heading1.font.size.pt == 18
-        assert heading1.font.bold is True
-
-        heading2 = doc.styles["Heading 2"]
-        assert heading2.font.name == "Calibri"
-        assert heading2.font.size.pt == 14
-        assert heading2.font.bold is True
-
-
-def test_template_paragraph_styles():
-    """Test that template has properly configured paragraph styles."""
-    with TemporaryDirectory() as tmpdir:
-        template_path = Path(tmpdir) / "template.docx"
-        DocxTemplateManager.create_modern_template(template_path, add_sample=True)
-
-        doc = Document(template_path)
-
-        # Test normal style properties
-        normal_style = doc.styles["Normal"]
-        assert normal_style.font.name == "Calibri"
-        assert normal_style.font.size.pt == 11
-
-
-def test_template_margins():
+@pytest.mark.parametrize(
+    ("style_name", "font_name", "size_pt", "bold"),
+    [
+        ("Heading 1", "Calibri", 18, True),
+        ("Heading 2", "Calibri", 14, True),
+        ("Normal", "Calibri", 11, None),
+        ("Code Block", "Consolas", 9, None),
+    ],
+)
+def test_template_style_properties(
+    modern_template_doc, style_name, font_name, size_pt, bold
+):
+    """Test font properties of the template's heading/body/code styles."""
+    font = modern_template_doc.styles[style_name].font
+
+    assert font.name == font_name
+    assert font.size.pt == size_pt
+    if bold is not None:
+        assert font.bold is bold
+
+
+def test_template_margins(modern_template_doc):
     """Test that template has correct margin settings."""
-    with TemporaryDirectory() as tmpdir:
-        template_path = Path(tmpdir) / "template.docx"
-        DocxTemplateManager.create_modern_template(template_path, add_sample=True)
+    section = modern_template_doc.sections[0]
+    margins = (
+        section.top_margin.emu,
+        section.bottom_margin.emu,
+        section.left_margin.emu,
+        section.right_margin.emu,
+    )
 
-        doc = Document(template_path)
-        section = doc.sections[0]
-
-        # Check 1-inch margins (914400 EMUs = 1 inch)
-        assert section.top_margin.emu == 914400
-        assert section.bottom_margin.emu == 914400
-        assert section.left_margin.emu == 914400
-        assert section.right_margin.emu == 914400
+    # Check 1-inch margins (914400 EMUs = 1 inch)
+    assert margins == (914400,) * 4
 
 
+@pytest.mark.no_mock_pandoc
 def test_template_with_converter():
     """Test using template with converter."""
     markdown_content = """# Test Heading 1
@@ -124,53 +120,34 @@ Final content.
         assert result == output_path
         assert output_path.exists()
 
-        # Verify output uses template styles
+        # Verify output uses template styles; materialize the paragraph
+        # list once instead of re-walking the document per assertion
         output_doc = Document(output_path)
-        headings = []
-        for paragraph in output_doc.paragraphs:
-            if paragraph.style and "heading" in paragraph.style.name.lower():
-                headings.append((paragraph.text, paragraph.style.name))
-
-        assert len(headings) >= 3
-        assert any("Test Heading 1" in h[0] for h in headings)
-        assert any("Test Heading 2" in h[0] for h in headings)
-        assert any("Test Heading 3" in h[0] for h in headings)
-
-
-def test_template_code_style():
-    """Test that template includes code block style."""
-    with TemporaryDirectory() as tmpdir:
-        template_path = Path(tmpdir) / "template.docx"
-        DocxTemplateManager.create_modern_template(template_path, add_sample=True)
-
-        doc = Document(template_path)
-        style_names = [style.name for style in doc.styles]
-
-        # Code Block style should exist
-        assert "Code Block" in style_names
+        heading_texts = [
+            p.text
+            for p in output_doc.paragraphs
+            if p.style and p.style.name in HEADING_STYLES
+        ]
 
-        code_style = doc.styles["Code Block"]
-        assert code_style.font.name == "Consolas"
-        assert code_style.font.size.pt == 9
+        assert len(heading_texts) >= 3
+        for expected in ("Test Heading 1", "Test Heading 2", "Test Heading 3"):
+            assert any(expected in text for text in heading_texts)
 
 
-def test_template_sample_content():
+def test_template_sample_content(modern_template_doc):
     """Test that template contains sample content for structure."""
-    with TemporaryDirectory() as tmpdir:
-        template_path = Path(tmpdir) / "template.docx"
-        DocxTemplateManager.create_modern_template(template_path, add_sample=True)
-        doc = Document(template_path)
+    paragraphs = list(modern_template_doc.paragraphs)
 
-        # Should have some sample content
-        assert len(doc.paragraphs) > 0
+    # Should have some sample content
+    assert len(paragraphs) > 0
 
-        # Check for sample headings
-        heading_texts = [
-            p.text
-            for p in doc.paragraphs
-            if p.style and "heading" in p.style.name.lower()
-        ]
-        assert len(heading_texts) >= 3  # At least 3 sample headings
+    # Check for sample headings
+    heading_texts = [
+        p.text
+        for p in paragraphs
+        if p.style and p.style.name in HEADING_STYLES
+    ]
+    assert len(heading_texts) >= 3  # At least 3 sample headings
 
 
 def test_template_custom_heading_styles():
@@ -196,32 +173,52 @@ def test_template_custom_heading_styles():
         assert code_style.font.size.pt == 12
 
 
-def test_template_reusability():
+@pytest.mark.no_mock_pandoc
+def test_template_reusability(tmp_path):
     """Test that template can be used multiple times."""
     markdown_content = """# Document Title
 
 This is test content.
 """
 
-    with TemporaryDirectory() as tmpdir:
-        tmpdir_path = Path(tmpdir)
-        template_path = tmpdir_path / "template.docx"
+    template_path = tmp_path / "template.docx"
 
-        # Create template once
-        DocxTemplateManager.create_modern_template(template_path)
+    # Create template once
+    DocxTemplateManager.create_modern_template(template_path)
 
-        # Use template multiple times
-        for i in range(3):
-            input_path = tmpdir_path / f"test{i}.md"
-            output_path = tmpdir_path / f"output{i}.docx"
+    # Use template multiple times through one converter and one batch call
+    pairs = []
+    for i in range(3):
+        input_path = tmp_path / f"test{i}.md"
+        input_path.write_text(markdown_content)
+        pairs.append((input_path, tmp_path / f"output{i}.docx"))
+
+    converter = MarkdownToDocxConverter(reference_doc=template_path)
+    results = converter.convert_many(pairs)
+
+    for (_, output_path), result in zip(pairs, results):
+        assert result == output_path
+        assert output_path.exists()
+
+
+def test_template_bytes_cache_reused():
+    """Test that repeat builds with identical config reuse cached bytes."""
+    from unittest.mock import patch
+
+    with TemporaryDirectory() as tmpdir:
+        tmpdir_path = Path(tmpdir)
+        first_path = tmpdir_path / "first.docx"
+        second_path = tmpdir_path / "second.docx"
 
-            input_path.write_text(markdown_content)
+        DocxTemplateManager.create_modern_template(first_path)
 
-            converter = MarkdownToDocxConverter(reference_doc=template_path)
-            result = converter.convert(input_path, output_path)
+        # The second build with identical configuration should not touch
+        # python-docx at all
+        with patch("markdown2docx.templates.Document") as mock_document:
+            DocxTemplateManager.create_modern_template(second_path)
+            mock_document.assert_not_called()
 
-            assert result == output_path
-            assert output_path.exists()
+        assert first_path.read_bytes() == second_path.read_bytes()
 
 
 def test_template_error_handling():